@@ -1,14 +1,13 @@
 """Main CLI game loop for the RPG."""
 
 import io
+import os
 import sys
 import random
-from pathlib import Path
 from typing import Optional
 
 # Add src to path FIRST
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
 # Fix Unicode encoding for Windows console
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
@@ -27,13 +26,55 @@ from rpg.systems.combat import resolve_attack
 from rpg.services.shop import ShopService
 
 
+# Exploration outcomes and their relative weights
+_EXPLORE_EVENTS = ("combat", "treasure", "skill", "nothing")
+_EXPLORE_WEIGHTS = (0.4, 0.3, 0.2, 0.1)
+
+# Enemy templates: (name, max_hp, attack, defense, gold reward)
+_ENEMY_TYPES = (
+    ("Goblin Scout", 40, 6, 2, 15),
+    ("Wolf", 50, 8, 3, 20),
+    ("Bandit", 60, 10, 4, 30),
+    ("Orc Warrior", 80, 12, 5, 50),
+)
+
+# Static menu screens, each emitted with a single write
+_MAIN_MENU = "\n1. New Game\n2. Load Game\n3. Quit\n\n"
+_VILLAGE_MENU = (
+    "\nWhat would you like to do?\n"
+    "1. [~]  Explore the wilderness\n"
+    "2. [X]  Training grounds (combat)\n"
+    "3. [+] Learn skills\n"
+    "4. [I] Inventory\n"
+    "5. [$] Visit shop\n"
+    "6. [B] Visit bank\n"
+    "7. [S] Save game\n"
+    "8. [Q] Quit\n"
+)
+_COMBAT_ACTIONS = "\n1. Attack\n2. Flee\n"
+_BANK_MENU = "\n1. Deposit\n2. Withdraw\n3. Back\n"
+
+# The village shop's wares are fixed, so the store is stocked once at import
+_SHOP_ITEMS = (
+    (Item(id="sword1", name="Iron Sword", equip_attack=10), 150),
+    (Item(id="armor1", name="Leather Armor", equip_defense=5), 120),
+    (Item(id="potion1", name="Health Potion", heal_amount=30), 50),
+    (Item(id="sword2", name="Steel Sword", equip_attack=20), 300),
+    (Item(id="armor2", name="Chain Mail", equip_defense=10), 250),
+)
+_GENERAL_STORE = ShopService("General Store")
+for _item, _price in _SHOP_ITEMS:
+    _GENERAL_STORE.add_item_for_sale(_item, _price)
+del _item, _price
+
+
 class RPGGame:
     """Main game controller for the CLI RPG."""
     
     def __init__(self):
         self.game_state: Optional[GameState] = None
         self.running = False
-        self.save_path = Path.home() / ".rpg_save.json"
+        self.save_path = os.path.join(os.path.expanduser("~"), ".rpg_save.json")
         
     def clear_screen(self):
         """Clear the console screen."""
@@ -41,25 +82,20 @@ class RPGGame:
     
     def print_header(self, text: str):
         """Print a formatted header."""
-        print("\n" + "=" * 60)
-        print(f"  {text}")
-        print("=" * 60)
+        sys.stdout.write(f"\n{'=' * 60}\n  {text}\n{'=' * 60}\n")
     
     def print_separator(self):
         """Print a separator line."""
         print("-" * 60)
     
     def get_input(self, prompt: str = "> ") -> str:
-        """Get user input with prompt."""
-        return input(prompt).strip().lower()
+        """Get user input with prompt (whitespace-trimmed; menus compare digits, so no case folding)."""
+        return input(prompt).strip()
     
     def show_main_menu(self):
         """Display the main menu."""
         self.print_header("[X]  PYTHON RPG - MAIN MENU  [X]")
-        print("\n1. New Game")
-        print("2. Load Game")
-        print("3. Quit")
-        print()
+        sys.stdout.write(_MAIN_MENU)
     
     def create_character(self) -> GameState:
         """Character creation wizard."""
@@ -119,12 +155,15 @@ class RPGGame:
         xp = game_state.leveling.xp(player)
         xp_needed = game_state.leveling.next_threshold(player)
         
-        print(f"\n[>] {player.name} - Level {level} {player.character_class.name if player.character_class else 'Adventurer'}")
-        print(f"   HP: {player.hp}/{player.max_hp}")
-        print(f"   ATK: {player.attack} | DEF: {player.defense}")
-        print(f"   XP: {xp}/{xp_needed}")
-        print(f"   $ Gold: ${player.currency}")
-        print(f"    Location: {game_state.location.title()}")
+        class_name = player.character_class.name if player.character_class else 'Adventurer'
+        sys.stdout.write(
+            f"\n[>] {player.name} - Level {level} {class_name}\n"
+            f"   HP: {player.hp}/{player.max_hp}\n"
+            f"   ATK: {player.attack} | DEF: {player.defense}\n"
+            f"   XP: {xp}/{xp_needed}\n"
+            f"   $ Gold: ${player.currency}\n"
+            f"    Location: {game_state.location.title()}\n"
+        )
     
     def game_loop(self):
         """Main game loop."""
@@ -132,15 +171,7 @@ class RPGGame:
             self.print_header("[#] VILLAGE CENTER")
             self.show_character_stats(self.game_state)
             
-            print("\nWhat would you like to do?")
-            print("1. [~]  Explore the wilderness")
-            print("2. [X]  Training grounds (combat)")
-            print("3. [+] Learn skills")
-            print("4. [I] Inventory")
-            print("5. [$] Visit shop")
-            print("6. [B] Visit bank")
-            print("7. [S] Save game")
-            print("8. [Q] Quit")
+            sys.stdout.write(_VILLAGE_MENU)
             
             choice = self.get_input("\nEnter choice (1-8): ")
             
@@ -168,22 +199,7 @@ class RPGGame:
         """Random exploration events."""
         self.print_header("[~]  EXPLORATION")
         
-        events = [
-            ("combat", 0.4),
-            ("treasure", 0.3),
-            ("skill", 0.2),
-            ("nothing", 0.1)
-        ]
-        
-        roll = random.random()
-        cumulative = 0.0
-        event = "nothing"
-        
-        for event_type, probability in events:
-            cumulative += probability
-            if roll < cumulative:
-                event = event_type
-                break
+        event = random.choices(_EXPLORE_EVENTS, weights=_EXPLORE_WEIGHTS, k=1)[0]
         
         if event == "combat":
             print("\n[X]  You encounter a monster!")
@@ -191,7 +207,7 @@ class RPGGame:
             self.combat_encounter()
         
         elif event == "treasure":
-            gold = random.randint(20, 100)
+            gold = random.randrange(20, 101)
             self.game_state.player.currency += gold
             print(f"\n$ You found a treasure chest containing ${gold} gold!")
             input("\nPress Enter to continue...")
@@ -226,14 +242,7 @@ class RPGGame:
         self.print_header("[X]  COMBAT!")
         
         # Generate enemy
-        enemy_types = [
-            ("Goblin Scout", 40, 6, 2, 15),
-            ("Wolf", 50, 8, 3, 20),
-            ("Bandit", 60, 10, 4, 30),
-            ("Orc Warrior", 80, 12, 5, 50),
-        ]
-        
-        enemy_data = random.choice(enemy_types)
+        enemy_data = random.choice(_ENEMY_TYPES)
         enemy = Character(
             name=enemy_data[0],
             max_hp=enemy_data[1],
@@ -249,17 +258,17 @@ class RPGGame:
         turn = 0
         while enemy.is_alive() and self.game_state.player.is_alive():
             turn += 1
-            print(f"\n--- Turn {turn} ---")
-            print(f"Your HP: {self.game_state.player.hp}/{self.game_state.player.max_hp}")
-            print(f"{enemy.name} HP: {enemy.hp}/{enemy.max_hp}")
-            
-            print("\n1. Attack")
-            print("2. Flee")
+            sys.stdout.write(
+                f"\n--- Turn {turn} ---\n"
+                f"Your HP: {self.game_state.player.hp}/{self.game_state.player.max_hp}\n"
+                f"{enemy.name} HP: {enemy.hp}/{enemy.max_hp}\n"
+            )
+            sys.stdout.write(_COMBAT_ACTIONS)
             
             choice = self.get_input("Action: ")
             
             if choice == "2":
-                if random.random() < 0.5:
+                if random.getrandbits(1):
                     print("\n> You fled successfully!")
                     input("\nPress Enter to continue...")
                     return
@@ -292,7 +301,7 @@ class RPGGame:
         print(f"\n* Victory! {enemy.name} has been defeated!")
         
         # Rewards
-        xp_gained = random.randint(10, 30)
+        xp_gained = random.randrange(10, 31)
         self.game_state.leveling.gain_xp(self.game_state.player, xp_gained)
         self.game_state.player.currency += enemy_reward
         self.game_state.enemies_defeated += 1
@@ -313,16 +322,20 @@ class RPGGame:
         """Display and manage skills."""
         self.print_header("[+] SKILLS")
         
-        # Get learned skill IDs
-        learned_ids = self.game_state.skills.learned(self.game_state.player)
-        
-        # Convert IDs to skill objects for display
-        learned_skills = [s for s in ALL_UNIVERSAL_SKILLS if s.id in learned_ids]
-        
-        # Get available skills to learn
-        available = [s for s in ALL_UNIVERSAL_SKILLS 
-                     if self.game_state.skills.can_learn(self.game_state.player, s) 
-                     and s.id not in learned_ids]
+        skills = self.game_state.skills
+        player = self.game_state.player
+        learned_ids = skills.learned(player)
+        preferred = player.character_class.preferred_skills if player.character_class else frozenset()
+        
+        # Split skills into learned and available (with preferred flag) in one pass
+        learned_skills = []
+        available = []
+        learnable = skills.can_learn_many(player, ALL_UNIVERSAL_SKILLS)
+        for skill, can_learn in zip(ALL_UNIVERSAL_SKILLS, learnable):
+            if skill.id in learned_ids:
+                learned_skills.append(skill)
+            elif can_learn:
+                available.append((skill, skill.id in preferred))
         
         print(f"\n[OK] Learned Skills ({len(learned_skills)}):")
         if learned_skills:
@@ -333,16 +346,16 @@ class RPGGame:
         
         print(f"\n Available to Learn ({len(available)}):")
         if available:
-            for i, skill in enumerate(available, 1):
-                bonus = " *" if self.game_state.player.character_class and skill.id in self.game_state.player.character_class.preferred_skills else ""
+            for i, (skill, is_preferred) in enumerate(available, 1):
+                bonus = " *" if is_preferred else ""
                 print(f"   {i}. {skill.name} ({skill.category}) - Level {skill.required_level}{bonus}")
             
             print("\nEnter number to learn skill, or 'b' to go back:")
             choice = self.get_input()
             
             if choice.isdigit() and 1 <= int(choice) <= len(available):
-                skill = available[int(choice) - 1]
-                self.game_state.skills.learn(self.game_state.player, skill)
+                skill, _ = available[int(choice) - 1]
+                skills.learn(player, skill)
                 print(f"\n* You learned {skill.name}!")
         else:
             print("   None available at your level!")
@@ -356,9 +369,10 @@ class RPGGame:
         items = self.game_state.inventory.list_items()
         
         if items:
+            equipped_ids = self.game_state.inventory.equipped_ids
             print("\nYour items:")
             for item in items:
-                equipped = " (Equipped)" if self.game_state.inventory.is_equipped(item.id) else ""
+                equipped = " (Equipped)" if item.id in equipped_ids else ""
                 print(f"   - {item.name}{equipped}")
         else:
             print("\nYour inventory is empty!")
@@ -369,38 +383,29 @@ class RPGGame:
         """Visit the shop."""
         self.print_header("[$] VILLAGE SHOP")
         
-        # Create shop with items
-        shop = ShopService("General Store")
-        
-        # Add items for sale
-        items_for_sale = [
-            (Item(id="sword1", name="Iron Sword", equip_attack=10), 150),
-            (Item(id="armor1", name="Leather Armor", equip_defense=5), 120),
-            (Item(id="potion1", name="Health Potion", heal_amount=30), 50),
-            (Item(id="sword2", name="Steel Sword", equip_attack=20), 300),
-            (Item(id="armor2", name="Chain Mail", equip_defense=10), 250),
-        ]
-        
-        for item, price in items_for_sale:
-            # Check if player already owns this item
-            owned_ids = [i.id for i in self.game_state.inventory.list_items()]
-            if item.id not in owned_ids:
-                shop.add_item_for_sale(item, price)
+        shop = _GENERAL_STORE
         
         print(f"\nWelcome to {shop.name}!")
         print(f"Your gold: ${self.game_state.player.currency}\n")
         
-        inventory = shop.list_inventory()
+        # Only offer items the player doesn't already own
+        owned_ids = self.game_state.inventory.owned_ids
+        inventory = [
+            (item, price) for item, price in _SHOP_ITEMS
+            if item.id not in owned_ids
+        ]
         if inventory:
-            print("Items for sale:")
+            lines = ["Items for sale:"]
             for i, (item, price) in enumerate(inventory, 1):
-                print(f"   {i}. {item.name} - ${price}")
+                lines.append(f"   {i}. {item.name} - ${price}")
                 if item.equip_attack:
-                    print(f"      ATK: +{item.equip_attack}")
+                    lines.append(f"      ATK: +{item.equip_attack}")
                 if item.equip_defense:
-                    print(f"      DEF: +{item.equip_defense}")
+                    lines.append(f"      DEF: +{item.equip_defense}")
                 if item.heal_amount:
-                    print(f"      Heals: {item.heal_amount} HP")
+                    lines.append(f"      Heals: {item.heal_amount} HP")
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
             
             print("\nEnter number to buy, or 'b' to go back:")
             choice = self.get_input()
@@ -409,6 +414,8 @@ class RPGGame:
                 item, price = inventory[int(choice) - 1]
                 if shop.sell_item_to(item.id, self.game_state.player, self.game_state.inventory):
                     print(f"\n[OK] Purchased {item.name}!")
+                    # The general store never runs out: put the item back on the shelf
+                    shop.add_item_for_sale(item, price)
                     
                     # Auto-equip if it's equipment and better
                     if item.equip_attack or item.equip_defense:
@@ -430,9 +437,7 @@ class RPGGame:
         print(f"\nAccount Balance: ${balance}")
         print(f"Gold in hand: ${self.game_state.player.currency}")
         
-        print("\n1. Deposit")
-        print("2. Withdraw")
-        print("3. Back")
+        sys.stdout.write(_BANK_MENU)
         
         choice = self.get_input("\nChoice: ")
         
@@ -472,12 +477,15 @@ class RPGGame:
     
     def load_game(self) -> bool:
         """Load a saved game."""
-        if not self.save_path.exists():
+        if not os.path.exists(self.save_path):
             print("\nX No saved game found!")
             input("\nPress Enter to continue...")
             return False
         
         try:
+            summary = GameState.read_save_summary(self.save_path)
+            level = f", level {summary['level']}" if summary["level"] else ""
+            print(f"\nFound save: {summary['player_name']}{level}, in the {summary['location']}")
             self.game_state = GameState.load_from_file(self.save_path)
             print("\n[OK] Game loaded successfully!")
             input("\nPress Enter to continue...")
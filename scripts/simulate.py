@@ -0,0 +1,53 @@
+"""Headless class-vs-class balance simulation.
+
+Usage:
+    python scripts/simulate.py [fights_per_matchup] [seed]
+"""
+
+import os
+import random
+import sys
+
+# Add src to path so imports work
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from rpg.entities.character import Character
+from rpg.entities.predefined_classes import WARRIOR, MAGE, ROGUE
+from rpg.systems.combat_batch import DRAW, SIDE_A_WINS, simulate_fights
+
+CRIT_CHANCE = 0.1
+
+
+def class_stats(character_class) -> tuple[int, int, int]:
+    """Return (max_hp, attack, defense) for a new-game character of this class."""
+    character = Character.from_class(
+        character_class, "Sim", max_hp=100, attack=5, defense=3
+    )
+    return (character.max_hp, character.attack, character.defense)
+
+
+def main() -> None:
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    rng = random.Random(seed)
+
+    classes = [WARRIOR, MAGE, ROGUE]
+    print(f"Simulating {fights} fights per matchup (crit chance {CRIT_CHANCE:.0%})")
+    for first in classes:
+        for second in classes:
+            results = simulate_fights(
+                [class_stats(first)] * fights,
+                [class_stats(second)] * fights,
+                random_provider=rng,
+                crit_chance=CRIT_CHANCE,
+            )
+            wins = results.count(SIDE_A_WINS)
+            draws = results.count(DRAW)
+            print(
+                f"  {first.name:<8} vs {second.name:<8} "
+                f"win rate {wins / fights:6.1%}  draws {draws}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-"""rpg package init"""
-
-__all__ = ["core"]
+"""rpg package init"""
+
+__all__ = ["core"]
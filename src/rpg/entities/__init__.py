@@ -1 +1 @@
-"""RPG entities package - Pure domain models."""
+"""RPG entities package - Pure domain models."""
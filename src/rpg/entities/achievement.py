@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Achievement:
     """Represents a single achievement definition (placeholder docstring)."""
     id: str
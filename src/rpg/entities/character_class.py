@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
 
-@dataclass
+def _hp_ratio(hp_multiplier: float) -> tuple[int, int]:
+    """Return ``hp_multiplier`` as a small (numerator, denominator) pair.
+
+    Finds the smallest denominator up to 100 that represents the multiplier
+    (e.g. 1.5 -> (3, 2), 0.8 -> (4, 5)), falling back to the exact float ratio.
+    """
+    for denominator in range(1, 101):
+        numerator = round(hp_multiplier * denominator)
+        if abs(numerator - hp_multiplier * denominator) < 1e-9:
+            return numerator, denominator
+    return hp_multiplier.as_integer_ratio()
+
+
+@dataclass(frozen=True, slots=True)
 class CharacterClass:
     """Represents a character class with stat modifiers and skill preferences.
 
@@ -17,7 +31,13 @@ class CharacterClass:
         hp_multiplier: Multiplier applied to base max_hp (1.0 = no change).
         attack_bonus: Flat bonus added to base attack stat.
         defense_bonus: Flat bonus added to base defense stat.
-        preferred_skills: List of skill IDs that this class learns more easily.
+        preferred_skills: Skill IDs that this class learns more easily (stored as a
+            frozenset of interned strings for O(1) membership checks).
+        hp_num: Numerator of hp_multiplier as an integer ratio (derived).
+        hp_den: Denominator of hp_multiplier as an integer ratio (derived).
+
+    Instances are immutable and hashable, so the predefined classes can be
+    shared freely and used as dict keys or cache keys.
 
     Raises:
         ValueError: If id or name is empty, or if hp_multiplier is non-positive.
@@ -30,12 +50,16 @@ class CharacterClass:
         ...     description="Tank",
         ...     hp_multiplier=1.5,
         ...     attack_bonus=2,
-        ...     preferred_skills=["sword_mastery"]
+        ...     preferred_skills=("sword_mastery",)
         ... )
         >>> warrior.hp_multiplier
         1.5
+        >>> warrior.hp_num, warrior.hp_den
+        (3, 2)
         >>> warrior.attack_bonus
         2
+        >>> "sword_mastery" in warrior.preferred_skills
+        True
 
         Validation enforced:
         >>> CharacterClass(id="", name="Bad", description="Test")
@@ -54,12 +78,25 @@ class CharacterClass:
     hp_multiplier: float = 1.0
     attack_bonus: int = 0
     defense_bonus: int = 0
-    preferred_skills: list[str] = field(default_factory=list)
+    preferred_skills: frozenset[str] = field(default_factory=frozenset)
+    hp_num: int = field(init=False, repr=False, compare=False, default=1)
+    hp_den: int = field(init=False, repr=False, compare=False, default=1)
 
     def __post_init__(self) -> None:
-        if not self.id:
-            raise ValueError("character class id must be non-empty")
-        if not self.name:
-            raise ValueError("character class name must be non-empty")
-        if self.hp_multiplier <= 0:
+        # Single guard on the happy path; work out which rule failed only on error
+        if not (self.id and self.name and self.hp_multiplier > 0):
+            if not self.id:
+                raise ValueError("character class id must be non-empty")
+            if not self.name:
+                raise ValueError("character class name must be non-empty")
             raise ValueError("hp_multiplier must be positive")
+        # Frozen dataclass: bypass __setattr__ to normalize the collection.
+        # Skill IDs are a small closed set, so intern them: lookups with an
+        # interned skill.id then match on identity before comparing characters.
+        object.__setattr__(
+            self, "preferred_skills", frozenset(map(sys.intern, self.preferred_skills))
+        )
+        # Integer ratio lets max_hp scaling stay in exact integer arithmetic
+        hp_num, hp_den = _hp_ratio(self.hp_multiplier)
+        object.__setattr__(self, "hp_num", hp_num)
+        object.__setattr__(self, "hp_den", hp_den)
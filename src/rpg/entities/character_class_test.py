@@ -1,51 +1,51 @@
 from rpg.entities.character import Character
 from rpg.entities.character_class import CharacterClass
-from rpg.entities.predefined_classes import WARRIOR, MAGE, ROGUE
+from rpg.entities.predefined_classes import MageCharacter, WarriorCharacter
 
 
-def test_warrior_class_modifies_base_stats():
+def test_warrior_class_modifies_base_stats(warrior):
     # Warrior gets 1.5x HP and +2 attack
-    warrior = Character("Conan", max_hp=100, attack=5, defense=2, character_class=WARRIOR)
+    conan = Character.from_class(warrior, "Conan", max_hp=100, attack=5, defense=2)
     
     # HP should be multiplied by 1.5
-    assert warrior.max_hp == 150
-    assert warrior.hp == 150
+    assert conan.max_hp == 150
+    assert conan.hp == 150
     
     # Attack should have +2 bonus
-    assert warrior.attack == 7  # 5 base + 2 bonus
+    assert conan.attack == 7  # 5 base + 2 bonus
     
     # Defense unchanged (no bonus)
-    assert warrior.defense == 2
+    assert conan.defense == 2
 
 
-def test_mage_class_modifies_base_stats():
+def test_mage_class_modifies_base_stats(mage):
     # Mage gets 0.8x HP and -1 defense
-    mage = Character("Merlin", max_hp=100, attack=3, defense=2, character_class=MAGE)
+    merlin = Character.from_class(mage, "Merlin", max_hp=100, attack=3, defense=2)
     
     # HP should be multiplied by 0.8
-    assert mage.max_hp == 80
-    assert mage.hp == 80
+    assert merlin.max_hp == 80
+    assert merlin.hp == 80
     
     # Attack unchanged (no bonus)
-    assert mage.attack == 3
+    assert merlin.attack == 3
     
     # Defense should have -1 penalty
-    assert mage.defense == 1  # 2 base - 1 penalty
+    assert merlin.defense == 1  # 2 base - 1 penalty
 
 
-def test_rogue_class_balanced_stats():
+def test_rogue_class_balanced_stats(rogue):
     # Rogue has balanced modifiers
-    rogue = Character("Shadow", max_hp=100, attack=5, defense=2, character_class=ROGUE)
+    shadow = Character.from_class(rogue, "Shadow", max_hp=100, attack=5, defense=2)
     
     # HP multiplier is 1.0 (no change)
-    assert rogue.max_hp == 100
-    assert rogue.hp == 100
+    assert shadow.max_hp == 100
+    assert shadow.hp == 100
     
     # Attack gets +1 bonus
-    assert rogue.attack == 6  # 5 base + 1 bonus
+    assert shadow.attack == 6  # 5 base + 1 bonus
     
     # Defense gets +1 bonus
-    assert rogue.defense == 3  # 2 base + 1 bonus
+    assert shadow.defense == 3  # 2 base + 1 bonus
 
 
 def test_character_without_class_uses_defaults():
@@ -75,3 +75,45 @@ def test_class_validation():
     
     with raises(ValueError):
         CharacterClass(id="bad", name="Bad", description="Test", hp_multiplier=-1)
+
+
+def test_predefined_classes_are_immutable_and_hashable(warrior, mage, rogue):
+    from dataclasses import FrozenInstanceError
+    from pytest import raises
+
+    with raises(FrozenInstanceError):
+        warrior.attack_bonus = 99
+
+    class_names = {warrior: "warrior", mage: "mage", rogue: "rogue"}
+    assert class_names[mage] == "mage"
+    assert "mining" in warrior.preferred_skills
+
+
+def test_classes_by_id_resolves_predefined_classes(warrior):
+    from pytest import raises
+    from rpg.entities.predefined_classes import CLASSES_BY_ID
+
+    assert CLASSES_BY_ID["warrior"] is warrior
+    assert CLASSES_BY_ID.get("paladin") is None
+    with raises(TypeError):
+        CLASSES_BY_ID["paladin"] = warrior
+
+
+def test_specialized_character_types_match_from_class(warrior, mage):
+    for character_type, character_class in ((WarriorCharacter, warrior), (MageCharacter, mage)):
+        specialized = character_type("Hero", max_hp=100, attack=5, defense=2)
+        reference = Character.from_class(character_class, "Hero", max_hp=100, attack=5, defense=2)
+
+        assert isinstance(specialized, Character)
+        assert specialized.character_class is character_class
+        assert (specialized.max_hp, specialized.hp, specialized.attack, specialized.defense) == (
+            reference.max_hp, reference.hp, reference.attack, reference.defense
+        )
+
+
+def test_specialized_character_type_rejects_conflicting_class(warrior, mage):
+    from pytest import raises
+
+    with raises(ValueError):
+        MageCharacter("Hero", max_hp=10, character_class=warrior)
+    assert MageCharacter("Hero", max_hp=10, character_class=mage).character_class is mage
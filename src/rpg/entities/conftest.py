@@ -0,0 +1,21 @@
+"""Shared fixtures for entity tests."""
+
+import pytest
+
+from rpg.entities.character_class import CharacterClass
+from rpg.entities.predefined_classes import WARRIOR, MAGE, ROGUE
+
+
+@pytest.fixture(scope="session")
+def warrior() -> CharacterClass:
+    return WARRIOR
+
+
+@pytest.fixture(scope="session")
+def mage() -> CharacterClass:
+    return MAGE
+
+
+@pytest.fixture(scope="session")
+def rogue() -> CharacterClass:
+    return ROGUE
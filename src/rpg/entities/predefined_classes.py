@@ -1,5 +1,8 @@
 """Predefined character classes."""
 
+from types import MappingProxyType
+
+from rpg.entities.character import Character
 from rpg.entities.character_class import CharacterClass
 
 
@@ -10,15 +13,15 @@ WARRIOR = CharacterClass(
     hp_multiplier=1.5,
     attack_bonus=2,
     defense_bonus=0,
-    preferred_skills=[
+    preferred_skills=(
         # Combat skills
         "sword_mastery",
         "shield_bash",
         # Universal skills
         "mining",
         "blacksmithing",
-        "first_aid"
-    ]
+        "first_aid",
+    )
 )
 
 MAGE = CharacterClass(
@@ -28,7 +31,7 @@ MAGE = CharacterClass(
     hp_multiplier=0.8,
     attack_bonus=0,
     defense_bonus=-1,
-    preferred_skills=[
+    preferred_skills=(
         # Combat skills
         "fireball",
         "heal",
@@ -36,8 +39,8 @@ MAGE = CharacterClass(
         # Universal skills
         "herbalism",
         "alchemy",
-        "navigation"
-    ]
+        "navigation",
+    )
 )
 
 ROGUE = CharacterClass(
@@ -47,7 +50,7 @@ ROGUE = CharacterClass(
     hp_multiplier=1.0,
     attack_bonus=1,
     defense_bonus=1,
-    preferred_skills=[
+    preferred_skills=(
         # Combat skills
         "lockpicking",
         "sneak",
@@ -55,6 +58,58 @@ ROGUE = CharacterClass(
         # Universal skills
         "foraging",
         "cooking",
-        "bartering"
-    ]
+        "bartering",
+    )
+)
+
+# Read-only lookup of predefined classes by id (e.g. when loading saves)
+CLASSES_BY_ID = MappingProxyType({c.id: c for c in (WARRIOR, MAGE, ROGUE)})
+
+
+def _specialize(character_class: CharacterClass) -> type[Character]:
+    """Build a ``Character`` subclass with ``character_class`` modifiers baked in.
+
+    The modifiers are bound as closure constants, so construction skips the
+    class lookup and cache probe that ``Character.from_class`` performs.
+    Passing a different ``character_class`` to the generated type raises
+    ``ValueError`` rather than being silently replaced.
+    """
+    hp_num = character_class.hp_num
+    hp_den = character_class.hp_den
+    attack_bonus = character_class.attack_bonus
+    defense_bonus = character_class.defense_bonus
+    base_post_init = Character.__post_init__
+
+    def __post_init__(self: Character) -> None:
+        if self.character_class is not None and self.character_class is not character_class:
+            raise ValueError(
+                f"{character_class.name}Character cannot take character_class "
+                f"{self.character_class.name!r}"
+            )
+        self.max_hp = self.max_hp * hp_num // hp_den
+        self.attack += attack_bonus
+        self.defense += defense_bonus
+        self.character_class = character_class
+        base_post_init(self)
+
+    return type(
+        f"{character_class.name}Character",
+        (Character,),
+        {
+            "__slots__": (),
+            "__post_init__": __post_init__,
+            "__doc__": f"Character created with {character_class.name} class modifiers applied.",
+        },
+    )
+
+
+# Character types with class modifiers pre-applied, e.g.
+# WarriorCharacter("Conan", max_hp=100, attack=5) == Character.from_class(WARRIOR, ...)
+WarriorCharacter = _specialize(WARRIOR)
+MageCharacter = _specialize(MAGE)
+RogueCharacter = _specialize(ROGUE)
+
+# Read-only lookup of specialized character types by class id
+CHARACTER_TYPES_BY_ID = MappingProxyType(
+    {WARRIOR.id: WarriorCharacter, MAGE.id: MageCharacter, ROGUE.id: RogueCharacter}
 )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False, match_args=False)
 class Objective:
     """Represents a single quest objective.
 
@@ -23,8 +24,15 @@ class Objective:
     description: str
     completed: bool = False
 
+    def __post_init__(self) -> None:
+        # Interned so set lookups by ID usually match on identity
+        self.id = sys.intern(self.id)
+
+    def __repr__(self) -> str:
+        return f"Objective({self.id!r}, completed={self.completed})"
+
 
-@dataclass
+@dataclass(slots=True)
 class Quest:
     """Represents a quest with one or more objectives.
 
@@ -68,13 +76,17 @@ class Quest:
     objectives: list[Objective] = field(default_factory=list)
 
     def __post_init__(self) -> None:
-        if not self.id:
-            raise ValueError("quest id must be non-empty")
-        if not self.name:
-            raise ValueError("quest name must be non-empty")
-        if not self.objectives:
+        # Single guard on the happy path; work out which rule failed only on error
+        if not (self.id and self.name and self.objectives):
+            if not self.id:
+                raise ValueError("quest id must be non-empty")
+            if not self.name:
+                raise ValueError("quest name must be non-empty")
             raise ValueError("quest must have at least one objective")
-        # Check for duplicate objective IDs
-        obj_ids = [obj.id for obj in self.objectives]
-        if len(obj_ids) != len(set(obj_ids)):
-            raise ValueError("quest objectives must have unique ids")
+        self.id = sys.intern(self.id)
+        # Check for duplicate objective IDs (single pass, stops at first duplicate)
+        seen_ids: set[str] = set()
+        for obj in self.objectives:
+            if obj.id in seen_ids:
+                raise ValueError("quest objectives must have unique ids")
+            seen_ids.add(obj.id)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False, repr=False, match_args=False)
 class Skill:
     """Represents a learnable skill with a name and level requirement.
 
@@ -42,9 +43,16 @@ class Skill:
     category: str = ""
 
     def __post_init__(self) -> None:
-        if not self.id:
-            raise ValueError("skill id must be non-empty")
-        if not self.name:
-            raise ValueError("skill name must be non-empty")
-        if self.required_level < 1:
+        # Single guard on the happy path; work out which rule failed only on error
+        if not (self.id and self.name and self.required_level >= 1):
+            if not self.id:
+                raise ValueError("skill id must be non-empty")
+            if not self.name:
+                raise ValueError("skill name must be non-empty")
             raise ValueError("required_level must be >= 1")
+        # Interned to match CharacterClass.preferred_skills, so membership
+        # tests against it usually match on identity
+        object.__setattr__(self, "id", sys.intern(self.id))
+
+    def __repr__(self) -> str:
+        return f"Skill({self.id!r}, {self.name!r})"
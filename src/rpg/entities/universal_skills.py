@@ -7,6 +7,8 @@ They are organized into three categories:
 - Utility: Survival and social skills
 """
 
+from types import MappingProxyType
+
 from rpg.entities.skill import Skill
 
 # Gathering Skills - Resource collection
@@ -97,8 +99,11 @@ NAVIGATION = Skill(
 )
 
 # Category collections for convenience
-GATHERING_SKILLS = [FISHING, MINING, HERBALISM, FORAGING]
-CRAFTING_SKILLS = [COOKING, ALCHEMY, BLACKSMITHING, TAILORING]
-UTILITY_SKILLS = [FIRST_AID, BARTERING, CAMPING, NAVIGATION]
+GATHERING_SKILLS = (FISHING, MINING, HERBALISM, FORAGING)
+CRAFTING_SKILLS = (COOKING, ALCHEMY, BLACKSMITHING, TAILORING)
+UTILITY_SKILLS = (FIRST_AID, BARTERING, CAMPING, NAVIGATION)
 
 ALL_UNIVERSAL_SKILLS = GATHERING_SKILLS + CRAFTING_SKILLS + UTILITY_SKILLS
+
+# Read-only lookup of universal skills by id
+SKILLS_BY_ID = MappingProxyType({s.id: s for s in ALL_UNIVERSAL_SKILLS})
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
+import zlib
 from dataclasses import dataclass
-from pathlib import Path
+from typing import Any
 
 from rpg.entities.character import Character
-from rpg.entities.predefined_classes import WARRIOR, MAGE, ROGUE
+from rpg.entities.predefined_classes import CHARACTER_TYPES_BY_ID, CLASSES_BY_ID
 from rpg.services.inventory import InventoryService
 from rpg.services.leveling import LevelingService
 from rpg.services.skills import SkillsService
@@ -15,8 +18,24 @@ from rpg.services.quest_log import QuestLogService
 from rpg.services.achievements import AchievementsService
 from rpg.services.bank import BankService
 
+# Prefix identifying zlib-compressed saves; plain JSON saves start with "{"
+SAVE_MAGIC = b"RPGZ"
 
-@dataclass
+# Fields copied into the uncompressed one-line header that follows SAVE_MAGIC,
+# so a save can be summarized (e.g. on a load menu) without decompressing it
+SAVE_SUMMARY_FIELDS = ("version", "player_name", "player_class", "level", "location")
+
+# Save schema version written by save_to_file. Saves without a "version" key
+# are version 0 (player fields only, no service state); version 1 added
+# inventory, bank and achievements; version 2 added level, XP and skills.
+SAVE_VERSION = 2
+
+# Built once: json.dumps with non-default options creates a new encoder per call.
+# No indent, so the C encoder is used; compact separators drop padding.
+_SAVE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+@dataclass(slots=True)
 class GameState:
     """Manages the complete state of the game."""
     
@@ -44,50 +63,37 @@ class GameState:
         Returns:
             New GameState with initialized services
         """
-        # Select class
-        class_map = {
-            "warrior": WARRIOR,
-            "mage": MAGE,
-            "rogue": ROGUE
-        }
-        char_class = class_map.get(character_class_choice.lower())
-        
-        # Create player with class bonuses applied
-        player = Character(
-            name=player_name,
-            max_hp=100,
-            attack=5,
-            defense=3,
-            character_class=char_class
-        )
+        # Select the character type with class bonuses baked in (classless if unknown)
+        player_type = CHARACTER_TYPES_BY_ID.get(character_class_choice.lower(), Character)
+        player = player_type(name=player_name, max_hp=100, attack=5, defense=3)
         player.currency = 100  # Starting money
         
-        # Initialize services
-        inventory = InventoryService()
-        leveling = LevelingService()
-        skills = SkillsService(leveling)
-        quests = QuestLogService()
-        achievements = AchievementsService()
-        bank = BankService("Village Bank")
-        
         return cls(
             player=player,
-            inventory=inventory,
-            leveling=leveling,
-            skills=skills,
-            quests=quests,
-            achievements=achievements,
-            bank=bank,
+            **cls._build_services(),
             location="village",
             turns_played=0,
             enemies_defeated=0
         )
+
+    @staticmethod
+    def _build_services() -> dict[str, Any]:
+        """Create fresh, empty services keyed by their ``GameState`` field names."""
+        leveling = LevelingService()
+        return {
+            "inventory": InventoryService(),
+            "leveling": leveling,
+            "skills": SkillsService(leveling),
+            "quests": QuestLogService(),
+            "achievements": AchievementsService(),
+            "bank": BankService("Village Bank"),
+        }
     
-    def save_to_file(self, filepath: Path) -> None:
-        """Save game state to JSON file."""
-        # Note: This is a simplified save system
-        # A full implementation would need custom serialization for all services
+    def save_to_file(self, filepath: str | os.PathLike[str]) -> None:
+        """Save game state to a zlib-compressed JSON file."""
+        # Note: quests are not persisted yet
         save_data = {
+            "version": SAVE_VERSION,
             "player_name": self.player.name,
             "player_hp": self.player.hp,
             "player_max_hp": self.player.max_hp,
@@ -98,55 +104,114 @@ class GameState:
             "location": self.location,
             "turns_played": self.turns_played,
             "enemies_defeated": self.enemies_defeated,
+            "inventory": self.inventory.to_dict(),
+            "bank_balance": self.bank.check_balance(self.player),
+            "achievements": sorted(self.achievements.earned(self.player)),
+            "level": self.leveling.level(self.player),
+            "xp": self.leveling.xp(self.player),
+            "skills": sorted(self.skills.learned(self.player)),
         }
         
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(save_data, f, indent=2)
+        # Encode in memory and write the UTF-8 bytes in one call, rather
+        # than letting json.dump stream many small chunks through a text file
+        payload = _SAVE_ENCODER.encode(save_data).encode("utf-8")
+        # Compact JSON escapes newlines inside strings, so the header is one line
+        summary = {field: save_data[field] for field in SAVE_SUMMARY_FIELDS}
+        header = _SAVE_ENCODER.encode(summary).encode("utf-8")
+        payload = SAVE_MAGIC + header + b"\n" + zlib.compress(payload, 3)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write a sibling temp file, flush it to disk and rename it over the
+        # target, so a crash mid-write never leaves a truncated save behind
+        temp_path = os.fspath(filepath) + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+            raise
     
+    @staticmethod
+    def read_save_summary(filepath: str | os.PathLike[str]) -> dict[str, Any]:
+        """Return the ``SAVE_SUMMARY_FIELDS`` of a save without loading the game.
+
+        Compressed saves are summarized from their header line alone; legacy
+        saves without a header are fully decoded (missing fields are None).
+        """
+        with open(filepath, "rb") as f:
+            if f.read(len(SAVE_MAGIC)) == SAVE_MAGIC and f.peek(1)[:1] == b"{":
+                return json.loads(f.readline())
+            f.seek(0)
+            payload = f.read()
+        if payload.startswith(SAVE_MAGIC):
+            payload = zlib.decompress(payload[len(SAVE_MAGIC):])
+        save_data = json.loads(payload)
+        summary = {field: save_data.get(field) for field in SAVE_SUMMARY_FIELDS}
+        summary["version"] = save_data.get("version", 0)
+        return summary
+
     @classmethod
-    def load_from_file(cls, filepath: Path) -> GameState:
-        """Load game state from JSON file."""
-        with open(filepath, "r") as f:
-            save_data = json.load(f)
+    def load_from_file(cls, filepath: str | os.PathLike[str]) -> GameState:
+        """Load game state from a save file (compressed or legacy plain JSON).
+
+        Raises:
+            ValueError: If the save was written by a newer, unsupported schema version
+        """
+        with open(filepath, "rb") as f:
+            payload = f.read()
+        if payload.startswith(SAVE_MAGIC):
+            body_start = len(SAVE_MAGIC)
+            if payload[body_start:body_start + 1] == b"{":
+                # Skip the summary header; the compressed body has every field
+                body_start = payload.index(b"\n", body_start) + 1
+            payload = zlib.decompress(payload[body_start:])
+        save_data = json.loads(payload)
+        version = save_data.get("version", 0)
+        if version > SAVE_VERSION:
+            raise ValueError(f"unsupported save version: {version}")
         
         # Reconstruct character with class
-        class_map = {
-            "warrior": WARRIOR,
-            "mage": MAGE,
-            "rogue": ROGUE
-        }
-        char_class = class_map.get(save_data["player_class"]) if save_data["player_class"] else None
+        char_class = CLASSES_BY_ID.get(save_data["player_class"]) if save_data["player_class"] else None
         
-        # Create player (class bonuses already applied in saved stats)
+        # Create player (class bonuses already applied in saved stats; the
+        # constructor only stores the class reference)
         player = Character(
             name=save_data["player_name"],
             max_hp=save_data["player_max_hp"],
             attack=save_data["player_attack"],
             defense=save_data["player_defense"],
-            character_class=None  # Don't reapply bonuses
+            character_class=char_class
         )
-        player.hp = save_data["player_hp"]
+        if char_class is not None:
+            # Same type new_game created. Switched after construction so the
+            # specialized __post_init__ does not apply the modifiers again;
+            # the subclasses add no slots, so the layout is unchanged.
+            player.__class__ = CHARACTER_TYPES_BY_ID.get(char_class.id, Character)
+        # Apply missing HP as damage so the alive flag stays in sync
+        player.take_damage(player.max_hp - save_data["player_hp"])
         player.currency = save_data["player_currency"]
-        player.character_class = char_class  # Restore class reference without reapplying bonuses
-        
-        # Reinitialize services (in a full game, these would be saved too)
-        inventory = InventoryService()
-        leveling = LevelingService()
-        skills = SkillsService(leveling)
-        quests = QuestLogService()
-        achievements = AchievementsService()
-        bank = BankService("Village Bank")
         
-        return cls(
+        state = cls(
             player=player,
-            inventory=inventory,
-            leveling=leveling,
-            skills=skills,
-            quests=quests,
-            achievements=achievements,
-            bank=bank,
+            **cls._build_services(),
             location=save_data["location"],
             turns_played=save_data["turns_played"],
             enemies_defeated=save_data["enemies_defeated"]
         )
+        
+        # Restore persisted service state (older saves predate some of it;
+        # quests are not saved yet and stay empty)
+        if version >= 1:
+            state.inventory = InventoryService.from_dict(save_data["inventory"])
+            if save_data["bank_balance"]:
+                state.bank.restore_balance(player, save_data["bank_balance"])
+            state.achievements.restore_earned(player, save_data["achievements"])
+        if version >= 2:
+            state.leveling.restore_progress(player, save_data["level"], save_data["xp"])
+            state.skills.restore_learned(player, save_data["skills"])
+        return state
@@ -0,0 +1,160 @@
+import os
+
+import pytest
+
+from rpg.game.game_state import GameState
+
+
+def test_save_and_load_round_trip(tmp_path):
+    state = GameState.new_game("Hero", "warrior")
+    state.player.take_damage(12)
+    state.location = "forest"
+    state.turns_played = 7
+    state.enemies_defeated = 2
+    save_path = tmp_path / "saves" / "game.json"
+
+    state.save_to_file(save_path)
+    loaded = GameState.load_from_file(save_path)
+
+    assert loaded.player.name == "Hero"
+    assert loaded.player.hp == state.player.hp
+    assert loaded.player.max_hp == state.player.max_hp
+    assert loaded.player.attack == state.player.attack
+    assert loaded.player.defense == state.player.defense
+    assert loaded.player.currency == state.player.currency
+    assert loaded.player.character_class is state.player.character_class
+    assert type(loaded.player) is type(state.player)
+    assert loaded.location == "forest"
+    assert loaded.turns_played == 7
+    assert loaded.enemies_defeated == 2
+    assert [path.name for path in save_path.parent.iterdir()] == ["game.json"]
+
+
+def test_save_and_load_restores_inventory_bank_and_achievements(tmp_path):
+    from rpg.entities.item import Item
+
+    state = GameState.new_game("Hero", "rogue")
+    base_attack = state.player.attack
+    state.inventory.add(Item(id="sword1", name="Iron Sword", equip_attack=10))
+    state.inventory.add(Item(id="potion1", name="Health Potion", heal_amount=30))
+    state.inventory.equip("sword1", state.player)
+    state.bank.deposit_from(state.player, 40)
+    state.achievements.record_purchase(state.player, True)
+    save_path = tmp_path / "game.json"
+
+    state.save_to_file(save_path)
+    loaded = GameState.load_from_file(save_path)
+
+    assert set(loaded.inventory.owned_ids) == {"sword1", "potion1"}
+    assert set(loaded.inventory.equipped_ids) == {"sword1"}
+    assert loaded.player.attack == base_attack + 10
+    assert loaded.bank.check_balance(loaded.player) == 40
+    assert loaded.player.currency == 60
+    assert loaded.achievements.earned(loaded.player) == {"first_purchase"}
+
+    # Unequipping after a load removes exactly the sword's bonus
+    loaded.inventory.unequip("sword1", loaded.player)
+    assert loaded.player.attack == base_attack
+
+
+def test_failed_save_removes_temp_file_and_keeps_previous_save(tmp_path, monkeypatch):
+    state = GameState.new_game("Hero", "warrior")
+    save_path = tmp_path / "game.json"
+    state.save_to_file(save_path)
+    previous = save_path.read_bytes()
+
+    def failing_replace(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    state.location = "forest"
+    with pytest.raises(OSError):
+        state.save_to_file(save_path)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["game.json"]
+    assert save_path.read_bytes() == previous
+
+
+def test_saves_are_compressed_and_legacy_json_still_loads(tmp_path):
+    import json
+
+    from rpg.game.game_state import SAVE_MAGIC
+
+    state = GameState.new_game("Hero", "mage")
+    save_path = tmp_path / "game.sav"
+    state.save_to_file(save_path)
+    assert save_path.read_bytes().startswith(SAVE_MAGIC)
+
+    legacy_path = tmp_path / "legacy.json"
+    legacy_path.write_text(json.dumps({
+        "player_name": "Old",
+        "player_hp": 40,
+        "player_max_hp": 80,
+        "player_attack": 3,
+        "player_defense": 1,
+        "player_currency": 25,
+        "player_class": "mage",
+        "location": "village",
+        "turns_played": 4,
+        "enemies_defeated": 1,
+    }, indent=2))
+    loaded = GameState.load_from_file(legacy_path)
+    assert loaded.player.hp == 40
+    assert loaded.player.currency == 25
+    assert loaded.inventory.list_items() == []
+
+
+def test_loading_save_from_newer_version_raises(tmp_path):
+    import json
+
+    from rpg.game.game_state import SAVE_VERSION
+
+    save_path = tmp_path / "future.json"
+    save_path.write_text(json.dumps({"version": SAVE_VERSION + 1}))
+    with pytest.raises(ValueError):
+        GameState.load_from_file(save_path)
+
+
+def test_save_and_load_restores_level_xp_and_skills(tmp_path):
+    from rpg.entities.universal_skills import FISHING
+
+    state = GameState.new_game("Hero", "warrior")
+    state.leveling.gain_xp(state.player, 27)
+    state.skills.learn(state.player, FISHING)
+    save_path = tmp_path / "game.sav"
+
+    state.save_to_file(save_path)
+    loaded = GameState.load_from_file(save_path)
+
+    assert loaded.leveling.level(loaded.player) == 3
+    assert loaded.leveling.xp(loaded.player) == 7
+    assert loaded.skills.learned(loaded.player) == {"fishing"}
+
+
+def test_read_save_summary_uses_header_and_handles_legacy_saves(tmp_path):
+    import json
+
+    from rpg.game.game_state import SAVE_VERSION
+
+    state = GameState.new_game("Hero", "mage")
+    state.location = "forest"
+    save_path = tmp_path / "game.sav"
+    state.save_to_file(save_path)
+
+    assert GameState.read_save_summary(save_path) == {
+        "version": SAVE_VERSION,
+        "player_name": "Hero",
+        "player_class": "mage",
+        "level": 1,
+        "location": "forest",
+    }
+
+    legacy_path = tmp_path / "legacy.json"
+    legacy_path.write_text(json.dumps({"player_name": "Old", "player_class": None, "location": "village"}))
+    assert GameState.read_save_summary(legacy_path) == {
+        "version": 0,
+        "player_name": "Old",
+        "player_class": None,
+        "level": None,
+        "location": "village",
+    }
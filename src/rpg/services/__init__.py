@@ -1 +1 @@
-"""RPG services package - Business logic and domain services."""
+"""RPG services package - Business logic and domain services."""
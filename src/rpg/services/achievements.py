@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, Set
+from typing import Dict, Iterable, Set
+from weakref import WeakKeyDictionary
+
 from rpg.entities.character import Character
 
 
 class AchievementsService:
     """Track earned achievements per character.
 
-    This service manages achievement tracking using identity-based storage.
+    This service manages achievement tracking keyed weakly on the character
+    object, so entries disappear when a character is garbage collected.
     Achievements are awarded through event recording methods and persist
-    only for the lifetime of the service instance.
+    only for the lifetime of the service instance. Each character's earned
+    achievements are stored as a bitmask over the known achievement IDs.
 
     Class Attributes:
         FIRST_PURCHASE_ID: Achievement ID for making first purchase.
@@ -30,21 +34,48 @@ class AchievementsService:
     FIRST_PURCHASE_ID = "first_purchase"
     QUEST_NOVICE_ID = "quest_novice"
 
+    # One bit per known achievement ID
+    _BITS: Dict[str, int] = {FIRST_PURCHASE_ID: 1 << 0, QUEST_NOVICE_ID: 1 << 1}
+
+    __slots__ = ("_earned",)
+
     def __init__(self) -> None:
-        self._earned: Dict[int, Set[str]] = {}
+        self._earned: WeakKeyDictionary[Character, int] = WeakKeyDictionary()
 
     def earned(self, character: Character) -> Set[str]:
-        return set(self._earned.get(id(character), set()))
+        mask = self._earned.get(character, 0)
+        return {achievement_id for achievement_id, bit in self._BITS.items() if mask & bit}
+
+    def restore_earned(self, character: Character, achievement_ids: Iterable[str]) -> None:
+        """Mark ``achievement_ids`` as earned for ``character`` (used when loading saves).
+
+        Raises:
+            ValueError: If an achievement ID is unknown
+
+        Examples:
+            >>> from rpg.entities.character import Character
+            >>> hero = Character("Hero", max_hp=50)
+            >>> achievements = AchievementsService()
+            >>> achievements.restore_earned(hero, ["first_purchase"])
+            >>> achievements.record_purchase(hero, True)  # Already earned
+            False
+        """
+        mask = 0
+        for achievement_id in achievement_ids:
+            bit = self._BITS.get(achievement_id)
+            if bit is None:
+                raise ValueError(f"unknown achievement id: {achievement_id}")
+            mask |= bit
+        self._earned[character] = self._earned.get(character, 0) | mask
 
     def _award(self, character: Character, achievement_id: str) -> bool:
-        key = id(character)
-        bucket = self._earned.get(key)
-        if bucket is None:
-            bucket = set[str]()
-            self._earned[key] = bucket
-        before = len(bucket)
-        bucket.add(achievement_id)
-        return len(bucket) > before
+        """Set the achievement's bit; return True if it was not already earned."""
+        bit = self._BITS[achievement_id]
+        current = self._earned.get(character, 0)
+        if current & bit:
+            return False
+        self._earned[character] = current | bit
+        return True
 
     def record_purchase(self, character: Character, purchase_success: bool) -> bool:
         """Record a purchase event and award first purchase achievement.
@@ -70,8 +101,6 @@ class AchievementsService:
         """
         if not purchase_success:
             return False
-        if self.FIRST_PURCHASE_ID in self.earned(character):
-            return False
         return self._award(character, self.FIRST_PURCHASE_ID)
 
     def record_quest_completion(self, character: Character, is_first: bool) -> bool:
@@ -100,6 +129,4 @@ class AchievementsService:
         """
         if not is_first:
             return False
-        if self.QUEST_NOVICE_ID in self.earned(character):
-            return False
         return self._award(character, self.QUEST_NOVICE_ID)
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 from rpg.entities.character import Character
 from rpg.entities.achievement import Achievement
 from rpg.services.achievements import AchievementsService
@@ -33,3 +36,27 @@ def test_no_award_on_failed_purchase():
     # Failed purchase should not award
     assert svc.record_purchase(hero, purchase_success=False) is False
     assert svc.earned(hero) == set()
+
+
+def test_earned_reports_each_awarded_achievement():
+    hero = Character("Hero", max_hp=20)
+    other = Character("Other", max_hp=20)
+    svc = AchievementsService()
+
+    svc.record_purchase(hero, purchase_success=True)
+    svc.record_quest_completion(hero, is_first=True)
+    svc.record_quest_completion(other, is_first=True)
+
+    assert svc.earned(hero) == {"first_purchase", "quest_novice"}
+    assert svc.earned(other) == {"quest_novice"}
+
+
+def test_achievements_do_not_keep_character_alive():
+    svc = AchievementsService()
+    hero = Character("Temp", max_hp=20)
+    svc.record_purchase(hero, purchase_success=True)
+    hero_ref = weakref.ref(hero)
+
+    del hero
+    gc.collect()
+    assert hero_ref() is None
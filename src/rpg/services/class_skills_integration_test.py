@@ -7,7 +7,7 @@ from rpg.services.skills import SkillsService
 
 def test_mage_learns_preferred_skill_at_reduced_level():
     # Fireball is preferred for mages, should require lower level
-    mage = Character("Wizard", max_hp=50, character_class=MAGE)
+    mage = Character.from_class(MAGE, "Wizard", max_hp=50)
     leveling = LevelingService()
     skills = SkillsService(leveling)
     
@@ -29,7 +29,7 @@ def test_mage_learns_preferred_skill_at_reduced_level():
 
 def test_warrior_learns_non_preferred_skill_at_normal_level():
     # Warrior trying to learn fireball needs the full level requirement
-    warrior = Character("Fighter", max_hp=100, character_class=WARRIOR)
+    warrior = Character.from_class(WARRIOR, "Fighter", max_hp=100)
     leveling = LevelingService()
     skills = SkillsService(leveling)
     
@@ -48,7 +48,7 @@ def test_warrior_learns_non_preferred_skill_at_normal_level():
 
 def test_warrior_learns_preferred_skill_at_reduced_level():
     # Sword Mastery is preferred for warriors
-    warrior = Character("Knight", max_hp=100, character_class=WARRIOR)
+    warrior = Character.from_class(WARRIOR, "Knight", max_hp=100)
     leveling = LevelingService()
     skills = SkillsService(leveling)
     
@@ -1,129 +1,260 @@
-from __future__ import annotations
-
-from rpg.entities.character import Character
-from rpg.entities.item import Item
-
-
-class InventoryService:
-    """Manages a character's collection of items with equip/unequip and consumable usage.
-
-    Service class that handles item management logic for a single character.
-    Tracks both available items and currently equipped items separately.
-    Equipping modifies character stats directly; unequipping reverses changes.
-    """
-
-    def __init__(self) -> None:
-        self._items: dict[str, Item] = {}
-        self._equipped: dict[str, Item] = {}
-
-    def add(self, item: Item) -> None:
-        """Add an item to the inventory by its unique ID."""
-        self._items[item.id] = item
-
-    def remove(self, item_id: str) -> Item | None:
-        """Remove and return item by ID, or None if not found."""
-        return self._items.pop(item_id, None)
-
-    def list_items(self) -> list[Item]:
-        """Return a list of all items currently in inventory (excludes equipped items tracking)."""
-        return list(self._items.values())
-
-    def equip(self, item_id: str, character: Character) -> bool:
-        """Equip an item, applying its stat bonuses to the character.
-
-        Modifies character's attack and defense in-place by adding item bonuses.
-        Item must exist in inventory to equip.
-
-        Args:
-            item_id: Unique ID of item to equip
-            character: Character to receive stat bonuses (modified in-place)
-
-        Returns:
-            True if item was equipped, False if item not found in inventory
-
-        Examples:
-            >>> character = Character("Hero", max_hp=20, attack=5, defense=2)
-            >>> sword = Item(id="sword1", name="Iron Sword", equip_attack=3)
-            >>> inventory = InventoryService()
-            >>> inventory.add(sword)
-            >>> inventory.equip("sword1", character)
-            True
-            >>> character.attack  # 5 + 3 = 8
-            8
-        """
-        item = self._items.get(item_id)
-        if item is None:
-            return False
-        # apply equip bonuses
-        character.attack += item.equip_attack
-        character.defense += item.equip_defense
-        self._equipped[item_id] = item
-        return True
-
-    def unequip(self, item_id: str, character: Character) -> bool:
-        """Unequip an item, removing its stat bonuses from the character.
-
-        Reverses stat changes by subtracting item bonuses. Item must be currently equipped.
-
-        Args:
-            item_id: Unique ID of equipped item to remove
-            character: Character to lose stat bonuses (modified in-place)
-
-        Returns:
-            True if item was unequipped, False if item not currently equipped
-
-        Examples:
-            >>> character = Character("Hero", max_hp=20, attack=8, defense=2)
-            >>> sword = Item(id="sword1", name="Iron Sword", equip_attack=3)
-            >>> inventory = InventoryService()
-            >>> inventory.add(sword)
-            >>> inventory.equip("sword1", character)
-            True
-            >>> character.attack  # 8 + 3 = 11
-            11
-            >>> inventory.unequip("sword1", character)
-            True
-            >>> character.attack  # 11 - 3 = 8 (restored)
-            8
-        """
-        item = self._equipped.pop(item_id, None)
-        if item is None:
-            return False
-        character.attack -= item.equip_attack
-        character.defense -= item.equip_defense
-        return True
-
-    def use_consumable(self, item_id: str, target: Character) -> bool:
-        """Use a consumable item on a target character, then remove it from inventory.
-
-        Applies healing effect if item has heal_amount > 0. Item is consumed (removed) after use.
-
-        Args:
-            item_id: Unique ID of consumable item
-            target: Character to receive the effect (modified in-place)
-
-        Returns:
-            True if item was used and removed, False if item not found or has no consumable effect
-
-        Examples:
-            >>> character = Character("Hero", max_hp=50)
-            >>> character.take_damage(20)  # hp = 30
-            >>> potion = Item(id="potion1", name="Health Potion", heal_amount=15)
-            >>> inventory = InventoryService()
-            >>> inventory.add(potion)
-            >>> inventory.use_consumable("potion1", character)
-            True
-            >>> character.hp  # 30 + 15 = 45
-            45
-            >>> inventory.list_items()  # Potion consumed and removed
-            []
-        """
-        item = self._items.get(item_id)
-        if item is None:
-            return False
-        if item.heal_amount > 0:
-            target.heal(item.heal_amount)
-            # remove consumable after use
-            self.remove(item_id)
-            return True
-        return False
+from __future__ import annotations
+
+from collections.abc import Set as AbstractSet
+from dataclasses import asdict
+from typing import Any
+
+from rpg.entities.character import Character
+from rpg.entities.item import Item
+
+
+class InventoryService:
+    """Manages a character's collection of items with equip/unequip and consumable usage.
+
+    Service class that handles item management logic for a single character.
+    Tracks both available items and currently equipped items separately.
+    Equipping modifies character stats directly; unequipping reverses changes.
+
+    Owned items are stored as parallel ID/item lists so listing the inventory
+    is a plain list copy; equipped items as parallel ID/bonus lists, where each
+    bonus is the (attack, defense) delta applied at equip time and subtracted
+    again on unequip. Player inventories hold a handful of items, where a
+    linear ID scan is cheaper than maintaining a hash table.
+    """
+
+    __slots__ = ("_item_ids", "_item_list", "_equipped_ids", "_equipped_bonuses")
+
+    def __init__(self) -> None:
+        self._item_ids: list[str] = []
+        self._item_list: list[Item] = []
+        self._equipped_ids: list[str] = []
+        self._equipped_bonuses: list[tuple[int, int]] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of owned and equipped items.
+
+        Examples:
+            >>> inventory = InventoryService()
+            >>> inventory.add(Item(id="potion1", name="Health Potion", heal_amount=20))
+            >>> inventory.to_dict()["equipped"]
+            []
+        """
+        return {
+            "items": [asdict(item) for item in self._item_list],
+            "equipped": list(self._equipped_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> InventoryService:
+        """Rebuild an inventory from a ``to_dict`` snapshot.
+
+        Equipped items are restored as equipped without re-applying their stat
+        bonuses, since saved character stats already include them. Equipped IDs
+        that are no longer owned are ignored.
+
+        Examples:
+            >>> character = Character("Hero", max_hp=20, attack=2)
+            >>> inventory = InventoryService()
+            >>> inventory.add(Item(id="sword1", name="Iron Sword", equip_attack=3))
+            >>> inventory.equip("sword1", character)
+            True
+            >>> restored = InventoryService.from_dict(inventory.to_dict())
+            >>> "sword1" in restored.equipped_ids
+            True
+            >>> restored.unequip("sword1", character)
+            True
+            >>> character.attack
+            2
+        """
+        inventory = cls()
+        for item_data in data["items"]:
+            inventory.add(Item(**item_data))
+        for item_id in data["equipped"]:
+            item = inventory._find(item_id)
+            if item is None:
+                continue
+            inventory._equipped_ids.append(item_id)
+            inventory._equipped_bonuses.append((item.equip_attack, item.equip_defense))
+        return inventory
+
+    def _find(self, item_id: str) -> Item | None:
+        """Return the owned item with this ID, or None if not found."""
+        item_ids = self._item_ids
+        if item_id in item_ids:
+            return self._item_list[item_ids.index(item_id)]
+        return None
+
+    def add(self, item: Item) -> None:
+        """Add an item to the inventory by its unique ID."""
+        item_ids = self._item_ids
+        if item.id in item_ids:
+            self._item_list[item_ids.index(item.id)] = item
+        else:
+            item_ids.append(item.id)
+            self._item_list.append(item)
+
+    def remove(self, item_id: str) -> Item | None:
+        """Remove and return item by ID, or None if not found.
+
+        Raises:
+            ValueError: If the item is equipped; unequip it first so its stat
+                bonus is taken back from the character
+        """
+        item_ids = self._item_ids
+        if item_id not in item_ids:
+            return None
+        if item_id in self._equipped_ids:
+            raise ValueError(f"cannot remove equipped item {item_id!r}; unequip it first")
+        index = item_ids.index(item_id)
+        del item_ids[index]
+        return self._item_list.pop(index)
+
+    def list_items(self) -> list[Item]:
+        """Return a list of all items currently in inventory (excludes equipped items tracking)."""
+        return self._item_list.copy()
+
+    @property
+    def owned_ids(self) -> AbstractSet[str]:
+        """Snapshot of the IDs of all items in inventory.
+
+        Fetch once and reuse for repeated membership checks; the set does not
+        follow later changes to the inventory.
+
+        Examples:
+            >>> inventory = InventoryService()
+            >>> inventory.add(Item(id="potion1", name="Health Potion", heal_amount=20))
+            >>> "potion1" in inventory.owned_ids
+            True
+        """
+        return frozenset(self._item_ids)
+
+    @property
+    def equipped_ids(self) -> AbstractSet[str]:
+        """Snapshot of the IDs of all currently equipped items.
+
+        Examples:
+            >>> character = Character("Hero", max_hp=20)
+            >>> inventory = InventoryService()
+            >>> inventory.add(Item(id="sword1", name="Iron Sword", equip_attack=3))
+            >>> "sword1" in inventory.equipped_ids
+            False
+            >>> inventory.equip("sword1", character)
+            True
+            >>> "sword1" in inventory.equipped_ids
+            True
+        """
+        return frozenset(self._equipped_ids)
+
+    def equip(self, item_id: str, character: Character) -> bool:
+        """Equip an item, applying its stat bonuses to the character.
+
+        Modifies character's attack and defense in-place by adding item bonuses.
+        Item must exist in inventory to equip.
+
+        Args:
+            item_id: Unique ID of item to equip
+            character: Character to receive stat bonuses (modified in-place)
+
+        Returns:
+            True if item was equipped, False if item not found in inventory
+
+        Examples:
+            >>> character = Character("Hero", max_hp=20, attack=5, defense=2)
+            >>> sword = Item(id="sword1", name="Iron Sword", equip_attack=3)
+            >>> inventory = InventoryService()
+            >>> inventory.add(sword)
+            >>> inventory.equip("sword1", character)
+            True
+            >>> character.attack  # 5 + 3 = 8
+            8
+        """
+        item = self._find(item_id)
+        if item is None:
+            return False
+        # apply equip bonuses
+        bonus = (item.equip_attack, item.equip_defense)
+        character.attack += bonus[0]
+        character.defense += bonus[1]
+        equipped_ids = self._equipped_ids
+        if item_id in equipped_ids:
+            self._equipped_bonuses[equipped_ids.index(item_id)] = bonus
+        else:
+            equipped_ids.append(item_id)
+            self._equipped_bonuses.append(bonus)
+        return True
+
+    def unequip(self, item_id: str, character: Character) -> bool:
+        """Unequip an item, removing its stat bonuses from the character.
+
+        Reverses stat changes by subtracting item bonuses. Item must be currently equipped.
+
+        Args:
+            item_id: Unique ID of equipped item to remove
+            character: Character to lose stat bonuses (modified in-place)
+
+        Returns:
+            True if item was unequipped, False if item not currently equipped
+
+        Examples:
+            >>> character = Character("Hero", max_hp=20, attack=8, defense=2)
+            >>> sword = Item(id="sword1", name="Iron Sword", equip_attack=3)
+            >>> inventory = InventoryService()
+            >>> inventory.add(sword)
+            >>> inventory.equip("sword1", character)
+            True
+            >>> character.attack  # 8 + 3 = 11
+            11
+            >>> inventory.unequip("sword1", character)
+            True
+            >>> character.attack  # 11 - 3 = 8 (restored)
+            8
+        """
+        equipped_ids = self._equipped_ids
+        if item_id not in equipped_ids:
+            return False
+        index = equipped_ids.index(item_id)
+        del equipped_ids[index]
+        attack_bonus, defense_bonus = self._equipped_bonuses.pop(index)
+        character.attack -= attack_bonus
+        character.defense -= defense_bonus
+        return True
+
+    def use_consumable(self, item_id: str, target: Character) -> bool:
+        """Use a consumable item on a target character, then remove it from inventory.
+
+        Applies healing effect if item has heal_amount > 0. Item is consumed (removed) after use.
+
+        Args:
+            item_id: Unique ID of consumable item
+            target: Character to receive the effect (modified in-place)
+
+        Returns:
+            True if item was used and removed, False if item not found or has no consumable effect
+
+        Raises:
+            ValueError: If the item is equipped (checked before any effect is applied)
+
+        Examples:
+            >>> character = Character("Hero", max_hp=50)
+            >>> character.take_damage(20)  # hp = 30
+            >>> potion = Item(id="potion1", name="Health Potion", heal_amount=15)
+            >>> inventory = InventoryService()
+            >>> inventory.add(potion)
+            >>> inventory.use_consumable("potion1", character)
+            True
+            >>> character.hp  # 30 + 15 = 45
+            45
+            >>> inventory.list_items()  # Potion consumed and removed
+            []
+        """
+        item = self._find(item_id)
+        if item is None:
+            return False
+        if item.heal_amount > 0:
+            if item_id in self._equipped_ids:
+                raise ValueError(f"cannot use equipped item {item_id!r}; unequip it first")
+            target.heal(item.heal_amount)
+            # remove consumable after use
+            self.remove(item_id)
+            return True
+        return False
@@ -1,39 +1,123 @@
-from rpg.entities.character import Character
-from rpg.entities.item import Item
-from rpg.services.inventory import InventoryService
-
-
-def test_add_and_remove_item():
-    inventory = InventoryService()
-    potion = Item(id="p1", name="Potion", heal_amount=5)
-    inventory.add(potion)
-    items = inventory.list_items()
-    assert len(items) == 1
-    assert items[0].id == "p1"
-    removed = inventory.remove("p1")
-    assert removed is not None
-    assert inventory.list_items() == []
-
-
-def test_equip_and_unequip_changes_stats():
-    character = Character("Hero", max_hp=20, attack=3, defense=1)
-    sword = Item(id="s1", name="Sword", equip_attack=4)
-    inventory = InventoryService()
-    inventory.add(sword)
-    equipped = inventory.equip("s1", character)
-    assert equipped
-    assert character.attack == 7
-    unequipped = inventory.unequip("s1", character)
-    assert unequipped
-    assert character.attack == 3
-
-
-def test_use_consumable_heals_and_removes():
-    character = Character("Healed", max_hp=20)
-    character.take_damage(8)
-    inventory = InventoryService()
-    potion = Item(id="p1", name="Potion", heal_amount=5)
-    inventory.add(potion)
-    assert inventory.use_consumable("p1", character)
-    assert character.hp == 17
-    assert inventory.list_items() == []
+import pytest
+
+from rpg.entities.character import Character
+from rpg.entities.item import Item
+from rpg.services.inventory import InventoryService
+
+
+def test_add_and_remove_item():
+    inventory = InventoryService()
+    potion = Item(id="p1", name="Potion", heal_amount=5)
+    inventory.add(potion)
+    items = inventory.list_items()
+    assert len(items) == 1
+    assert items[0].id == "p1"
+    removed = inventory.remove("p1")
+    assert removed is not None
+    assert inventory.list_items() == []
+
+
+def test_equip_and_unequip_changes_stats():
+    character = Character("Hero", max_hp=20, attack=3, defense=1)
+    sword = Item(id="s1", name="Sword", equip_attack=4)
+    inventory = InventoryService()
+    inventory.add(sword)
+    equipped = inventory.equip("s1", character)
+    assert equipped
+    assert character.attack == 7
+    unequipped = inventory.unequip("s1", character)
+    assert unequipped
+    assert character.attack == 3
+
+
+def test_use_consumable_heals_and_removes():
+    character = Character("Healed", max_hp=20)
+    character.take_damage(8)
+    inventory = InventoryService()
+    potion = Item(id="p1", name="Potion", heal_amount=5)
+    inventory.add(potion)
+    assert inventory.use_consumable("p1", character)
+    assert character.hp == 17
+    assert inventory.list_items() == []
+
+
+def test_owned_and_equipped_ids_track_inventory():
+    character = Character("Hero", max_hp=20, attack=3)
+    inventory = InventoryService()
+    inventory.add(Item(id="s1", name="Sword", equip_attack=4))
+    inventory.add(Item(id="p1", name="Potion", heal_amount=5))
+
+    assert set(inventory.owned_ids) == {"s1", "p1"}
+    assert set(inventory.equipped_ids) == set()
+
+    inventory.equip("s1", character)
+    assert set(inventory.equipped_ids) == {"s1"}
+
+    inventory.unequip("s1", character)
+    inventory.remove("p1")
+    assert set(inventory.equipped_ids) == set()
+    assert set(inventory.owned_ids) == {"s1"}
+
+
+def test_adding_existing_id_replaces_item_in_place():
+    inventory = InventoryService()
+    inventory.add(Item(id="p1", name="Potion", heal_amount=5))
+    inventory.add(Item(id="s1", name="Sword", equip_attack=4))
+    inventory.add(Item(id="p1", name="Greater Potion", heal_amount=20))
+
+    assert [item.name for item in inventory.list_items()] == ["Greater Potion", "Sword"]
+    assert inventory.owned_ids == {"p1", "s1"}
+
+
+def test_owned_and_equipped_ids_cannot_desync_storage():
+    inventory = InventoryService()
+    inventory.add(Item(id="p1", name="Potion", heal_amount=5))
+
+    with pytest.raises(AttributeError):
+        inventory.owned_ids.add("x")  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError):
+        inventory.equipped_ids.add("x")  # type: ignore[attr-defined]
+    assert [item.id for item in inventory.list_items()] == ["p1"]
+
+
+def test_unequip_removes_the_bonus_applied_at_equip_time():
+    character = Character("Hero", max_hp=20, attack=3)
+    sword = Item(id="s1", name="Sword", equip_attack=4)
+    inventory = InventoryService()
+    inventory.add(sword)
+    inventory.equip("s1", character)
+
+    sword.equip_attack = 9  # e.g. upgraded while equipped
+    inventory.unequip("s1", character)
+
+    assert character.attack == 3
+
+
+def test_equipped_items_cannot_be_removed_or_consumed():
+    character = Character("Hero", max_hp=20, attack=3)
+    inventory = InventoryService()
+    inventory.add(Item(id="s1", name="Sword", equip_attack=4))
+    inventory.add(Item(id="p1", name="Potion", heal_amount=5))
+    inventory.equip("s1", character)
+    inventory.equip("p1", character)
+    character.take_damage(5)
+
+    with pytest.raises(ValueError):
+        inventory.remove("s1")
+    with pytest.raises(ValueError):
+        inventory.use_consumable("p1", character)
+    assert character.hp == 15
+    assert inventory.equipped_ids == {"s1", "p1"}
+
+    # Unequipping first takes the bonus back, then removal succeeds
+    assert inventory.unequip("s1", character)
+    assert inventory.remove("s1") is not None
+    assert character.attack == 3
+
+    restored = InventoryService.from_dict(inventory.to_dict())
+    assert restored.equipped_ids == {"p1"}
+
+
+def test_from_dict_ignores_stale_equipped_ids():
+    restored = InventoryService.from_dict({"items": [], "equipped": ["gone"]})
+    assert restored.equipped_ids == set()
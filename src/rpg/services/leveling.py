@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Sequence
+from weakref import WeakKeyDictionary
+
 from rpg.entities.character import Character
 
+# XP required per level (demo simplification: flat, level-independent curve)
+XP_PER_LEVEL = 10
+
+# progress_ratio for every possible carried XP value (always 0..XP_PER_LEVEL-1).
+# A lookup table rather than a reciprocal multiply, which would not be exact
+# (3 * 0.1 != 3 / 10).
+_PROGRESS_RATIOS = tuple(xp / XP_PER_LEVEL for xp in range(XP_PER_LEVEL))
+
 
 class LevelingService:
     """Track per-character XP and levels.
@@ -12,7 +22,8 @@ class LevelingService:
     - Level threshold is currently a constant 10 XP per level (demo simplification).
     - XP carries over after leveling up (excess applied to next level).
     - Negative XP gains raise ``ValueError``.
-    - Storage uses ``id(character)`` (identity-based, not persistent across reloads).
+    - Storage is keyed weakly on the character object (identity-based, dropped
+      when the character is garbage collected, not persistent across reloads).
 
     Examples:
         Basic leveling and carry-over:
@@ -40,25 +51,47 @@ class LevelingService:
         ...     lvl.gain_xp(hero, -1)
     """
 
+    __slots__ = ("_total_xp",)
+
     def __init__(self) -> None:
-        self._xp: Dict[int, int] = {}
-        self._level: Dict[int, int] = {}
+        # Total XP ever earned per character. On the flat curve level and carried
+        # XP are its divmod by XP_PER_LEVEL, so one int replaces a (level, xp) pair
+        # and grants are a plain addition.
+        self._total_xp: WeakKeyDictionary[Character, int] = WeakKeyDictionary()
 
     def level(self, character: Character) -> int:
         """Return the current level for ``character`` (defaults to 1)."""
-        return self._level.get(id(character), 1)
+        return self._total_xp.get(character, 0) // XP_PER_LEVEL + 1
 
     def xp(self, character: Character) -> int:
         """Return current accumulated XP toward next level (defaults to 0)."""
-        return self._xp.get(id(character), 0)
+        return self._total_xp.get(character, 0) % XP_PER_LEVEL
 
     def next_threshold(self, character: Character) -> int:
-        """Return XP required for next level (constant 10 for demo)."""
-        return 10
+        """Return XP required for next level (constant ``XP_PER_LEVEL`` for demo)."""
+        return XP_PER_LEVEL
 
     def progress_ratio(self, character: Character) -> float:
         """Return fraction (0.0–1.0) of progress toward next level."""
-        return self.xp(character) / float(self.next_threshold(character))
+        return _PROGRESS_RATIOS[self._total_xp.get(character, 0) % XP_PER_LEVEL]
+
+    def restore_progress(self, character: Character, level: int, xp: int) -> None:
+        """Set ``character``'s level and XP directly (used when loading saves).
+
+        Raises:
+            ValueError: If ``level`` is below 1 or ``xp`` is outside 0..XP_PER_LEVEL-1
+
+        Examples:
+            >>> from rpg.entities.character import Character
+            >>> hero = Character("Hero", max_hp=20)
+            >>> leveling = LevelingService()
+            >>> leveling.restore_progress(hero, 4, 7)
+            >>> leveling.level(hero), leveling.xp(hero)
+            (4, 7)
+        """
+        if level < 1 or not 0 <= xp < XP_PER_LEVEL:
+            raise ValueError(f"invalid level/xp: {level}/{xp}")
+        self._total_xp[character] = (level - 1) * XP_PER_LEVEL + xp
 
     def gain_xp(self, character: Character, amount: int) -> None:
         """Add XP to ``character`` and apply level-ups with carry-over.
@@ -72,14 +105,35 @@ class LevelingService:
         """
         if amount < 0:
             raise ValueError("xp amount must be non-negative")
-        key = id(character)
-        current_xp = self._xp.get(key, 0) + int(amount)
-        current_level = self._level.get(key, 1)
-
-        # Process leveling with carry-over
-        threshold = self.next_threshold(character)
-        while current_xp >= threshold:
-            current_xp -= threshold
-            current_level += 1
-        self._xp[key] = current_xp
-        self._level[key] = current_level
+        # Level-ups and carry-over fall out of the running total (see __init__)
+        total_xp = self._total_xp
+        total_xp[character] = total_xp.get(character, 0) + amount
+
+    def gain_xp_batch(self, characters: Sequence[Character], amounts: Sequence[int]) -> None:
+        """Grant XP to many characters at once (e.g. a whole party after a fight).
+
+        Equivalent to calling ``gain_xp`` for each pair in order, but amounts are
+        validated once up front, so a bad amount leaves every character unchanged.
+
+        Args:
+            characters: Characters receiving XP (may repeat)
+            amounts: Non-negative XP per character, paired by position
+
+        Raises:
+            ValueError: If any amount is negative or the sequences differ in length
+
+        Examples:
+            >>> from rpg.entities.character import Character
+            >>> party = [Character("Hero", max_hp=20), Character("Mage", max_hp=18)]
+            >>> leveling = LevelingService()
+            >>> leveling.gain_xp_batch(party, [12, 25])
+            >>> [(leveling.level(member), leveling.xp(member)) for member in party]
+            [(2, 2), (3, 5)]
+        """
+        if len(characters) != len(amounts):
+            raise ValueError("characters and amounts must have the same length")
+        if min(amounts, default=0) < 0:
+            raise ValueError("xp amount must be non-negative")
+        total_xp = self._total_xp
+        for character, amount in zip(characters, amounts):
+            total_xp[character] = total_xp.get(character, 0) + amount
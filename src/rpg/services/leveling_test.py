@@ -1,3 +1,8 @@
+import gc
+import weakref
+
+import pytest
+
 from rpg.entities.character import Character
 from rpg.services.leveling import LevelingService
 
@@ -44,3 +49,40 @@ def test_next_threshold_and_progress_ratio():
     svc.gain_xp(hero, 7)
     assert svc.next_threshold(hero) == 10
     assert 0.69 < svc.progress_ratio(hero) < 0.71  # 7/10 ≈ 0.7
+
+
+def test_leveling_does_not_keep_character_alive():
+    svc = LevelingService()
+    hero = Character("Temp", max_hp=20)
+    svc.gain_xp(hero, 15)
+    hero_ref = weakref.ref(hero)
+
+    del hero
+    gc.collect()
+    assert hero_ref() is None
+
+
+def test_large_xp_grant_levels_up_in_one_step():
+    hero = Character("Hero", max_hp=30)
+    svc = LevelingService()
+
+    svc.gain_xp(hero, 10_003)
+    assert svc.level(hero) == 1001
+    assert svc.xp(hero) == 3
+
+
+def test_gain_xp_batch_matches_individual_grants_and_validates_first():
+    hero = Character("Hero", max_hp=30)
+    mage = Character("Mage", max_hp=20)
+    batch = LevelingService()
+    single = LevelingService()
+
+    batch.gain_xp_batch([hero, mage, hero], [7, 31, 8])
+    for character, amount in [(hero, 7), (mage, 31), (hero, 8)]:
+        single.gain_xp(character, amount)
+    for character in (hero, mage):
+        assert (batch.level(character), batch.xp(character)) == (single.level(character), single.xp(character))
+
+    with pytest.raises(ValueError):
+        batch.gain_xp_batch([hero, mage], [5, -1])
+    assert (batch.level(hero), batch.xp(hero)) == (2, 5)
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
-from typing import Dict, Set
+from typing import Dict, Set, Tuple
+from weakref import WeakKeyDictionary
+
 from rpg.entities.character import Character
 from rpg.entities.quest import Quest
 
 
+class _QuestState:
+    """Quest progress of a single character within one ``QuestLogService``."""
+
+    __slots__ = ("progress", "active", "completed")
+
+    def __init__(self) -> None:
+        # quest_id -> bitmask of completed objectives (one entry per accepted quest)
+        self.progress: Dict[str, int] = {}
+        # Accepted quest ids, split by completion as objectives are completed
+        self.active: Set[str] = set()
+        self.completed: Set[str] = set()
+
+
 class QuestLogService:
     """Track accepted and completed quests per character.
 
     This service manages quest acceptance and objective completion tracking
-    using identity-based storage. Quest progress persists only for the
-    lifetime of the service instance.
+    using identity-based storage (keyed weakly on the character object).
+    Quest progress persists only for the lifetime of the service instance.
 
     Examples:
         >>> from rpg.entities.character import Character
@@ -33,13 +48,14 @@ class QuestLogService:
         True
     """
 
+    __slots__ = ("_states", "_objective_bits")
+
     def __init__(self) -> None:
-        # Map character id -> quest_id -> set of completed objective ids
-        self._quest_progress: Dict[int, Dict[str, Set[str]]] = {}
-        # Map character id -> set of accepted quest ids
-        self._accepted: Dict[int, Set[str]] = {}
-        # Store quest definitions to check completion
-        self._quests: Dict[str, Quest] = {}
+        # All quest state of one character, found with a single lookup
+        self._states: WeakKeyDictionary[Character, _QuestState] = WeakKeyDictionary()
+        # Per quest, built once at accept time: objective id -> its progress
+        # bit, and the mask with every objective's bit set
+        self._objective_bits: Dict[str, Tuple[Dict[str, int], int]] = {}
 
     def accept(self, character: Character, quest: Quest) -> bool:
         """Accept a quest for the character.
@@ -63,21 +79,20 @@ class QuestLogService:
             >>> log.accept(hero, quest)
             False
         """
-        key = id(character)
-        accepted_set = self._accepted.get(key, set())
-        if quest.id in accepted_set:
+        state = self._states.get(character)
+        if state is None:
+            state = _QuestState()
+            self._states[character] = state
+        # One probe both checks for and records the acceptance
+        progress = state.progress
+        accepted_before = len(progress)
+        progress.setdefault(quest.id, 0)
+        if len(progress) == accepted_before:
             return False
+        state.active.add(quest.id)
 
-        if key not in self._accepted:
-            self._accepted[key] = set()
-        self._accepted[key].add(quest.id)
-
-        if key not in self._quest_progress:
-            self._quest_progress[key] = {}
-        self._quest_progress[key][quest.id] = set()
-        
-        # Store quest definition
-        self._quests[quest.id] = quest
+        objective_bits = {obj.id: 1 << index for index, obj in enumerate(quest.objectives)}
+        self._objective_bits[quest.id] = (objective_bits, (1 << len(objective_bits)) - 1)
         return True
 
     def complete_objective(self, character: Character, quest_id: str, objective_id: str) -> bool:
@@ -108,23 +123,25 @@ class QuestLogService:
             >>> log.complete_objective(hero, "q1", "invalid")  # Invalid objective
             False
         """
-        key = id(character)
-        progress = self._quest_progress.get(key, {})
-        if quest_id not in progress:
+        state = self._states.get(character)
+        if state is None:
+            return False
+        completed_mask = state.progress.get(quest_id)
+        if completed_mask is None:
             return False
 
         # Validate objective exists in quest
-        if quest_id not in self._quests:
-            return False
-        quest = self._quests[quest_id]
-        valid_objective_ids = {obj.id for obj in quest.objectives}
-        if objective_id not in valid_objective_ids:
+        objective_bits, full_mask = self._objective_bits[quest_id]
+        bit = objective_bits.get(objective_id)
+        if bit is None or completed_mask & bit:
             return False
 
-        completed_objectives = progress[quest_id]
-        before = len(completed_objectives)
-        completed_objectives.add(objective_id)
-        return len(completed_objectives) > before
+        completed_mask |= bit
+        state.progress[quest_id] = completed_mask
+        if completed_mask == full_mask:
+            state.active.discard(quest_id)
+            state.completed.add(quest_id)
+        return True
 
     def is_completed(self, character: Character, quest_id: str) -> bool:
         """Check if all objectives for a quest are completed.
@@ -157,18 +174,8 @@ class QuestLogService:
             >>> log.is_completed(hero, "q1")
             True
         """
-        key = id(character)
-        if quest_id not in self._quests:
-            return False
-        
-        quest = self._quests[quest_id]
-        progress = self._quest_progress.get(key, {})
-        if quest_id not in progress:
-            return False
-        
-        completed_objectives = progress[quest_id]
-        all_objective_ids = {obj.id for obj in quest.objectives}
-        return all_objective_ids == completed_objectives
+        state = self._states.get(character)
+        return state is not None and quest_id in state.completed
 
     def active(self, character: Character) -> list[str]:
         """Get all active (incomplete) quest IDs for a character.
@@ -195,9 +202,8 @@ class QuestLogService:
             >>> log.active(hero)
             []
         """
-        key = id(character)
-        accepted_set = self._accepted.get(key, set())
-        return [qid for qid in accepted_set if not self.is_completed(character, qid)]
+        state = self._states.get(character)
+        return list(state.active) if state is not None else []
 
     def completed(self, character: Character) -> list[str]:
         """Get all completed quest IDs for a character.
@@ -224,6 +230,33 @@ class QuestLogService:
             >>> log.completed(hero)
             ['q1']
         """
-        key = id(character)
-        accepted_set = self._accepted.get(key, set())
-        return [qid for qid in accepted_set if self.is_completed(character, qid)]
+        state = self._states.get(character)
+        return list(state.completed) if state is not None else []
+
+    def partition_quests(self, character: Character) -> tuple[list[str], list[str]]:
+        """Get active and completed quest IDs together, for views that show both.
+
+        Args:
+            character: The character to check.
+
+        Returns:
+            Tuple of (active quest IDs, completed quest IDs).
+
+        Examples:
+            >>> from rpg.entities.character import Character
+            >>> from rpg.entities.quest import Quest, Objective
+            >>> hero = Character("Hero", max_hp=50)
+            >>> log = QuestLogService()
+            >>> for quest_id in ("q1", "q2"):
+            ...     quest = Quest(id=quest_id, name="Q", description="D",
+            ...                   objectives=[Objective(id="obj1", description="Task")])
+            ...     _ = log.accept(hero, quest)
+            >>> log.complete_objective(hero, "q2", "obj1")
+            True
+            >>> log.partition_quests(hero)
+            (['q1'], ['q2'])
+        """
+        state = self._states.get(character)
+        if state is None:
+            return [], []
+        return list(state.active), list(state.completed)
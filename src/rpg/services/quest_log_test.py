@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 from rpg.entities.character import Character
 from rpg.entities.quest import Quest, Objective
 from rpg.services.quest_log import QuestLogService
@@ -95,3 +98,39 @@ def test_completing_invalid_objective_returns_false():
 
     # Invalid quest ID
     assert log.complete_objective(hero, "invalid_quest", "obj1") is False
+
+
+def test_quest_moves_to_completed_only_after_last_objective():
+    hero = Character("Hero", max_hp=20)
+    log = QuestLogService()
+    errand = Quest(id="errand", name="Errand", description="D", objectives=[
+        Objective(id="a", description="A"),
+        Objective(id="b", description="B"),
+    ])
+    chores = Quest(id="chores", name="Chores", description="D", objectives=[
+        Objective(id="c", description="C"),
+    ])
+    log.accept(hero, errand)
+    log.accept(hero, chores)
+
+    log.complete_objective(hero, "errand", "a")
+    log.complete_objective(hero, "errand", "a")  # Repeat does not count twice
+    assert sorted(log.active(hero)) == ["chores", "errand"]
+    assert log.completed(hero) == []
+
+    log.complete_objective(hero, "errand", "b")
+    assert log.active(hero) == ["chores"]
+    assert log.completed(hero) == ["errand"]
+
+
+def test_quest_log_does_not_keep_character_alive():
+    log = QuestLogService()
+    hero = Character("Temp", max_hp=20)
+    log.accept(hero, Quest(id="q1", name="Q", description="D", objectives=[
+        Objective(id="o1", description="O"),
+    ]))
+    hero_ref = weakref.ref(hero)
+
+    del hero
+    gc.collect()
+    assert hero_ref() is None
@@ -1,91 +1,133 @@
-from __future__ import annotations
-
-from rpg.entities.character import Character
-from rpg.entities.item import Item
-from rpg.services.inventory import InventoryService
-
-
-class ShopService:
-    """Service for managing a shop where characters can buy items with currency.
-
-    Handles shop inventory with items and their prices. Manages purchase transactions
-    including currency validation and item transfer to character's inventory service.
-
-    Attributes:
-        name: Shop's display name
-    """
-
-    def __init__(self, name: str) -> None:
-        """Initialize a new shop with the given name.
-
-        Args:
-            name: Shop's display name
-        """
-        self.name = name
-        self._inventory: dict[str, tuple[Item, int]] = {}
-
-    def add_item_for_sale(self, item: Item, price: int) -> None:
-        """Add an item to the shop's inventory for sale.
-
-        Args:
-            item: Item to sell
-            price: Price in dollars (currency)
-
-        Examples:
-            >>> shop = ShopService("Armory")
-            >>> sword = Item(id="sword1", name="Iron Sword", equip_attack=5)
-            >>> shop.add_item_for_sale(sword, price=100)
-            >>> len(shop.list_inventory())
-            1
-        """
-        self._inventory[item.id] = (item, price)
-
-    def list_inventory(self) -> list[tuple[Item, int]]:
-        """Return list of all items for sale with their prices.
-
-        Returns:
-            List of tuples containing (Item, price)
-        """
-        return list(self._inventory.values())
-
-    def sell_item_to(
-        self, item_id: str, buyer: Character, buyer_inventory: InventoryService
-    ) -> bool:
-        """Sell an item from shop inventory to a buyer.
-
-        Transfers item to buyer's inventory service and deducts currency if buyer has sufficient funds.
-        Item is removed from shop inventory after successful sale.
-
-        Args:
-            item_id: Unique ID of item to sell
-            buyer: Character purchasing the item (modified in-place if successful)
-            buyer_inventory: Buyer's inventory service to receive the item
-
-        Returns:
-            True if sale successful, False if item not in stock or buyer has insufficient funds
-
-        Examples:
-            >>> shop = ShopService("Potion Shop")
-            >>> character = Character("Hero", max_hp=50)
-            >>> character.add_currency(100)
-            >>> inventory = InventoryService()
-            >>> potion = Item(id="potion1", name="Health Potion", heal_amount=20)
-            >>> shop.add_item_for_sale(potion, price=50)
-            >>> shop.sell_item_to("potion1", character, inventory)
-            True
-            >>> character.currency
-            50
-            >>> len(inventory.list_items())
-            1
-        """
-        if item_id not in self._inventory:
-            return False
-
-        item, price = self._inventory[item_id]
-
-        if not buyer.remove_currency(price):
-            return False
-
-        buyer_inventory.add(item)
-        del self._inventory[item_id]
-        return True
+from __future__ import annotations
+
+from array import array
+
+from rpg.entities.character import Character
+from rpg.entities.item import Item
+from rpg.services.inventory import InventoryService
+
+
+class ShopService:
+    """Service for managing a shop where characters can buy items with currency.
+
+    Handles shop inventory with items and their prices. Manages purchase transactions
+    including currency validation and item transfer to character's inventory service.
+
+    Stock is kept as parallel lists of item IDs, items and prices (prices in a
+    compact ``array``), plus an ID -> position index for O(1) lookup. Listing
+    order is the order items were first put up for sale.
+
+    Attributes:
+        name: Shop's display name
+    """
+
+    __slots__ = ("name", "_ids", "_items", "_prices", "_index", "_listing")
+
+    def __init__(self, name: str) -> None:
+        """Initialize a new shop with the given name.
+
+        Args:
+            name: Shop's display name
+        """
+        self.name = name
+        self._ids: list[str] = []
+        self._items: list[Item] = []
+        self._prices: array[int] = array("q")
+        self._index: dict[str, int] = {}
+        # Cached list_inventory() result; None after any stock change
+        self._listing: tuple[tuple[Item, int], ...] | None = None
+
+    def add_item_for_sale(self, item: Item, price: int) -> None:
+        """Add an item to the shop's inventory for sale.
+
+        Args:
+            item: Item to sell
+            price: Price in dollars (currency)
+
+        Examples:
+            >>> shop = ShopService("Armory")
+            >>> sword = Item(id="sword1", name="Iron Sword", equip_attack=5)
+            >>> shop.add_item_for_sale(sword, price=100)
+            >>> len(shop.list_inventory())
+            1
+        """
+        position = self._index.get(item.id)
+        if position is None:
+            self._index[item.id] = len(self._ids)
+            self._ids.append(item.id)
+            self._items.append(item)
+            self._prices.append(price)
+        else:
+            self._items[position] = item
+            self._prices[position] = price
+        self._listing = None
+
+    def list_inventory(self) -> tuple[tuple[Item, int], ...]:
+        """Return all items for sale with their prices.
+
+        The tuple is built once per stock change and shared between calls;
+        being immutable, callers cannot corrupt later listings.
+
+        Returns:
+            Tuple of (Item, price) pairs
+        """
+        listing = self._listing
+        if listing is None:
+            listing = self._listing = tuple(zip(self._items, self._prices))
+        return listing
+
+    def sell_item_to(
+        self, item_id: str, buyer: Character, buyer_inventory: InventoryService
+    ) -> bool:
+        """Sell an item from shop inventory to a buyer.
+
+        Transfers item to buyer's inventory service and deducts currency if buyer has sufficient funds.
+        Item is removed from shop inventory after successful sale.
+
+        Args:
+            item_id: Unique ID of item to sell
+            buyer: Character purchasing the item (modified in-place if successful)
+            buyer_inventory: Buyer's inventory service to receive the item
+
+        Returns:
+            True if sale successful, False if item not in stock or buyer has insufficient funds
+
+        Examples:
+            >>> shop = ShopService("Potion Shop")
+            >>> character = Character("Hero", max_hp=50)
+            >>> character.add_currency(100)
+            >>> inventory = InventoryService()
+            >>> potion = Item(id="potion1", name="Health Potion", heal_amount=20)
+            >>> shop.add_item_for_sale(potion, price=50)
+            >>> shop.sell_item_to("potion1", character, inventory)
+            True
+            >>> character.currency
+            50
+            >>> len(inventory.list_items())
+            1
+        """
+        position = self._index.get(item_id)
+        if position is None:
+            return False
+
+        price = self._prices[position]
+        # Check funds up front so a failed sale never touches the buyer
+        if buyer.currency < price:
+            return False
+        buyer.remove_currency(price)
+
+        buyer_inventory.add(self._items[position])
+        self._remove_at(position)
+        return True
+
+    def _remove_at(self, position: int) -> None:
+        """Drop the stock entry at ``position``, keeping the remaining order."""
+        ids = self._ids
+        del self._index[ids[position]]
+        del ids[position]
+        del self._items[position]
+        del self._prices[position]
+        index = self._index
+        for later_position in range(position, len(ids)):
+            index[ids[later_position]] = later_position
+        self._listing = None
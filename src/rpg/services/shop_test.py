@@ -1,77 +1,110 @@
-import pytest
-
-from rpg.entities.character import Character
-from rpg.entities.item import Item
-from rpg.services.inventory import InventoryService
-from rpg.services.shop import ShopService
-
-
-def test_shop_creation():
-    shop = ShopService(name="General Store")
-    assert shop.name == "General Store"
-    assert shop.list_inventory() == []
-
-
-def test_add_item_for_sale():
-    shop = ShopService(name="Armory")
-    sword = Item(id="sword1", name="Iron Sword", equip_attack=5)
-    shop.add_item_for_sale(sword, price=100)
-    inventory = shop.list_inventory()
-    assert len(inventory) == 1
-    assert inventory[0][0].id == "sword1"
-    assert inventory[0][1] == 100
-
-
-def test_sell_item_to_success():
-    shop = ShopService(name="Potion Shop")
-    character = Character("Hero", max_hp=50)
-    character.add_currency(150)
-    inventory = InventoryService()
-
-    potion = Item(id="potion1", name="Health Potion", heal_amount=20)
-    shop.add_item_for_sale(potion, price=50)
-
-    result = shop.sell_item_to("potion1", character, inventory)
-    assert result is True
-    assert character.currency == 100
-    assert len(inventory.list_items()) == 1
-    assert inventory.list_items()[0].id == "potion1"
-
-
-def test_sell_item_to_insufficient_funds():
-    shop = ShopService(name="Expensive Shop")
-    character = Character("Poor Hero", max_hp=50)
-    character.add_currency(25)
-    inventory = InventoryService()
-
-    sword = Item(id="sword1", name="Iron Sword", equip_attack=5)
-    shop.add_item_for_sale(sword, price=100)
-
-    result = shop.sell_item_to("sword1", character, inventory)
-    assert result is False
-    assert character.currency == 25
-    assert len(inventory.list_items()) == 0
-
-
-def test_sell_item_to_not_in_stock():
-    shop = ShopService(name="Empty Shop")
-    character = Character("Rich Hero", max_hp=50)
-    character.add_currency(500)
-    inventory = InventoryService()
-
-    result = shop.sell_item_to("nonexistent", character, inventory)
-    assert result is False
-    assert character.currency == 500
-
-
-def test_sell_item_to_removes_from_shop():
-    shop = ShopService(name="One Item Shop")
-    character = Character("Buyer", max_hp=50)
-    character.add_currency(100)
-    inventory = InventoryService()
-
-    armor = Item(id="armor1", name="Leather Armor", equip_defense=3)
-    shop.add_item_for_sale(armor, price=75)
-
-    shop.sell_item_to("armor1", character, inventory)
-    assert len(shop.list_inventory()) == 0
+import pytest
+
+from rpg.entities.character import Character
+from rpg.entities.item import Item
+from rpg.services.inventory import InventoryService
+from rpg.services.shop import ShopService
+
+
+def test_shop_creation():
+    shop = ShopService(name="General Store")
+    assert shop.name == "General Store"
+    assert shop.list_inventory() == ()
+
+
+def test_add_item_for_sale():
+    shop = ShopService(name="Armory")
+    sword = Item(id="sword1", name="Iron Sword", equip_attack=5)
+    shop.add_item_for_sale(sword, price=100)
+    inventory = shop.list_inventory()
+    assert len(inventory) == 1
+    assert inventory[0][0].id == "sword1"
+    assert inventory[0][1] == 100
+
+
+def test_sell_item_to_success():
+    shop = ShopService(name="Potion Shop")
+    character = Character("Hero", max_hp=50)
+    character.add_currency(150)
+    inventory = InventoryService()
+
+    potion = Item(id="potion1", name="Health Potion", heal_amount=20)
+    shop.add_item_for_sale(potion, price=50)
+
+    result = shop.sell_item_to("potion1", character, inventory)
+    assert result is True
+    assert character.currency == 100
+    assert len(inventory.list_items()) == 1
+    assert inventory.list_items()[0].id == "potion1"
+
+
+def test_sell_item_to_insufficient_funds():
+    shop = ShopService(name="Expensive Shop")
+    character = Character("Poor Hero", max_hp=50)
+    character.add_currency(25)
+    inventory = InventoryService()
+
+    sword = Item(id="sword1", name="Iron Sword", equip_attack=5)
+    shop.add_item_for_sale(sword, price=100)
+
+    result = shop.sell_item_to("sword1", character, inventory)
+    assert result is False
+    assert character.currency == 25
+    assert len(inventory.list_items()) == 0
+
+
+def test_sell_item_to_not_in_stock():
+    shop = ShopService(name="Empty Shop")
+    character = Character("Rich Hero", max_hp=50)
+    character.add_currency(500)
+    inventory = InventoryService()
+
+    result = shop.sell_item_to("nonexistent", character, inventory)
+    assert result is False
+    assert character.currency == 500
+
+
+def test_sell_item_to_removes_from_shop():
+    shop = ShopService(name="One Item Shop")
+    character = Character("Buyer", max_hp=50)
+    character.add_currency(100)
+    inventory = InventoryService()
+
+    armor = Item(id="armor1", name="Leather Armor", equip_defense=3)
+    shop.add_item_for_sale(armor, price=75)
+
+    shop.sell_item_to("armor1", character, inventory)
+    assert len(shop.list_inventory()) == 0
+
+
+def test_list_inventory_reflects_stock_changes_after_caching():
+    shop = ShopService(name="Market")
+    character = Character("Buyer", max_hp=50)
+    character.add_currency(100)
+    potion = Item(id="potion1", name="Potion", heal_amount=10)
+    shop.add_item_for_sale(potion, price=20)
+
+    assert shop.list_inventory() is shop.list_inventory()  # Cached between calls
+
+    sword = Item(id="sword1", name="Sword", equip_attack=2)
+    shop.add_item_for_sale(sword, price=60)
+    assert [item.id for item, _ in shop.list_inventory()] == ["potion1", "sword1"]
+
+    shop.sell_item_to("potion1", character, InventoryService())
+    assert shop.list_inventory() == ((sword, 60),)
+
+
+def test_selling_keeps_remaining_stock_in_order_and_purchasable():
+    shop = ShopService(name="Market")
+    character = Character("Buyer", max_hp=50)
+    character.add_currency(100)
+    inventory = InventoryService()
+    for index, price in enumerate((10, 20, 30)):
+        shop.add_item_for_sale(Item(id=f"item{index}", name=f"Item {index}"), price=price)
+
+    assert shop.sell_item_to("item0", character, inventory) is True
+    assert [(item.id, price) for item, price in shop.list_inventory()] == [("item1", 20), ("item2", 30)]
+
+    assert shop.sell_item_to("item2", character, inventory) is True
+    assert character.currency == 60
+    assert [item.id for item in inventory.list_items()] == ["item0", "item2"]
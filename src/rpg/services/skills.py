@@ -1,11 +1,44 @@
 from __future__ import annotations
 
-from typing import Dict, Set
+from collections.abc import Set as AbstractSet
+from typing import Iterable, Iterator, Set
+from weakref import WeakKeyDictionary
+
 from rpg.entities.character import Character
 from rpg.entities.skill import Skill
 from rpg.services.leveling import LevelingService
 
 
+class _LearnedSkills(AbstractSet):
+    """Read-only, live view of one character's learned skill ids.
+
+    Stored per character by ``SkillsService``, which adds to ``_skill_ids``
+    directly; callers only get the read-only set interface.
+    """
+
+    __slots__ = ("_skill_ids",)
+
+    def __init__(self) -> None:
+        self._skill_ids: Set[str] = set()
+
+    def __contains__(self, skill_id: object) -> bool:
+        return skill_id in self._skill_ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._skill_ids)
+
+    def __len__(self) -> int:
+        return len(self._skill_ids)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._skill_ids!r})"
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> frozenset[str]:
+        # Set operators (|, &, -) build their result here: return a plain frozenset
+        return frozenset(iterable)
+
+
 class SkillsService:
     """Manage learned skills per character with class-based bonuses.
 
@@ -14,7 +47,8 @@ class SkillsService:
     - If character has a class and skill is in class.preferred_skills,
       level requirement is reduced by class_level_reduction (default 2).
     - Duplicate learn attempts are ignored (returns False).
-    - Identity-based storage using id(character) (not persistent).
+    - Identity-based storage keyed weakly on the character (not persistent;
+      dropped when the character is garbage collected).
 
     Examples:
         Basic skill learning without class:
@@ -34,12 +68,12 @@ class SkillsService:
         True
         >>> skills.learn(hero, fireball)
         True
-        >>> skills.learned(hero)
-        {'fireball'}
+        >>> sorted(skills.learned(hero))
+        ['fireball']
 
         Class bonus reduces level requirement:
         >>> from rpg.entities.predefined_classes import MAGE
-        >>> mage = Character("Wizard", max_hp=50, character_class=MAGE)
+        >>> mage = Character.from_class(MAGE, "Wizard", max_hp=50)
         >>> fireball_adv = Skill(id="fireball", name="Fireball", required_level=5)
         >>> leveling2 = LevelingService()
         >>> skills2 = SkillsService(leveling2)
@@ -50,14 +84,40 @@ class SkillsService:
         True
     """
 
+    __slots__ = ("_learned", "_leveling", "_class_level_reduction")
+
     def __init__(self, leveling: LevelingService | None = None, class_level_reduction: int = 2) -> None:
-        self._learned: Dict[int, Set[str]] = {}
+        self._learned: WeakKeyDictionary[Character, _LearnedSkills] = WeakKeyDictionary()
         self._leveling = leveling or LevelingService()
         self._class_level_reduction = class_level_reduction
 
-    def learned(self, character: Character) -> Set[str]:
-        """Return a copy of skill ids learned by ``character``."""
-        return set(self._learned.get(id(character), set()))
+    def learned(self, character: Character) -> AbstractSet[str]:
+        """Return a live, read-only view of skill ids learned by ``character``.
+
+        The same view is returned on every call and reflects later ``learn``
+        calls; it has no methods to add skills. Use ``set(...)`` for a snapshot.
+        """
+        learned = self._learned
+        view = learned.get(character)
+        if view is None:
+            view = learned[character] = _LearnedSkills()
+        return view
+
+    def restore_learned(self, character: Character, skill_ids: Iterable[str]) -> None:
+        """Mark ``skill_ids`` as learned for ``character`` (used when loading saves).
+
+        Level requirements are not re-checked: the skills were learned legitimately
+        when the save was written.
+
+        Examples:
+            >>> from rpg.entities.character import Character
+            >>> hero = Character("Hero", max_hp=20)
+            >>> skills = SkillsService()
+            >>> skills.restore_learned(hero, ["fishing"])
+            >>> sorted(skills.learned(hero))
+            ['fishing']
+        """
+        self.learned(character)._skill_ids.update(skill_ids)
 
     def can_learn(self, character: Character, skill: Skill) -> bool:
         """Return True if character meets the level requirement for ``skill``.
@@ -67,12 +127,47 @@ class SkillsService:
         """
         required_level = skill.required_level
         
-        # Apply class bonus if skill is preferred
-        if character.character_class and skill.id in character.character_class.preferred_skills:
+        # Apply class bonus if skill is preferred. Not memoized: this is one
+        # frozenset lookup, cheaper than hashing an lru_cache key, and the
+        # character's level is read fresh so level-ups need no invalidation.
+        character_class = character.character_class
+        if character_class is not None and skill.id in character_class.preferred_skills:
             required_level = max(1, required_level - self._class_level_reduction)
         
         return self._leveling.level(character) >= required_level
 
+    def can_learn_many(self, character: Character, skills: Iterable[Skill]) -> list[bool]:
+        """Return ``can_learn(character, skill)`` for each skill, in order.
+
+        For skill pickers and other listings: the character's level and class
+        are looked up once for the whole batch instead of once per skill.
+
+        Examples:
+            >>> from rpg.entities.character import Character
+            >>> from rpg.entities.predefined_classes import MAGE
+            >>> mage = Character.from_class(MAGE, "Wizard", max_hp=50)
+            >>> skills = SkillsService()
+            >>> skills.can_learn_many(mage, [
+            ...     Skill(id="fireball", name="Fireball", required_level=3),
+            ...     Skill(id="cleave", name="Cleave", required_level=3),
+            ... ])
+            [True, False]
+        """
+        level = self._leveling.level(character)
+        character_class = character.character_class
+        if character_class is None:
+            return [level >= skill.required_level for skill in skills]
+        preferred_skills = character_class.preferred_skills
+        reduction = self._class_level_reduction
+        return [
+            level >= (
+                max(1, skill.required_level - reduction)
+                if skill.id in preferred_skills
+                else skill.required_level
+            )
+            for skill in skills
+        ]
+
     def learn(self, character: Character, skill: Skill) -> bool:
         """Attempt to learn ``skill``; return True only if newly added.
 
@@ -81,11 +176,13 @@ class SkillsService:
         """
         if not self.can_learn(character, skill):
             return False
-        key = id(character)
-        bucket = self._learned.get(key)
-        if bucket is None:
-            bucket = set[str]()  # explicit element type
-            self._learned[key] = bucket
-        before = len(bucket)
-        bucket.add(skill.id)
-        return len(bucket) > before
+        learned = self._learned
+        view = learned.get(character)
+        if view is None:
+            view = learned[character] = _LearnedSkills()
+        bucket = view._skill_ids
+        skill_id = skill.id
+        if skill_id in bucket:
+            return False
+        bucket.add(skill_id)
+        return True
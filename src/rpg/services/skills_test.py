@@ -1,5 +1,12 @@
+import gc
+import weakref
+
+import pytest
+
 from rpg.entities.character import Character
+from rpg.entities.predefined_classes import MAGE, ROGUE, WARRIOR
 from rpg.entities.skill import Skill
+from rpg.entities.universal_skills import ALL_UNIVERSAL_SKILLS
 from rpg.services.leveling import LevelingService
 from rpg.services.skills import SkillsService
 
@@ -28,3 +35,43 @@ def test_learn_skill_with_level_requirement():
     # Learning again returns False and doesn't duplicate
     assert skills.learn(hero, fireball) is False
     assert skills.learned(hero) == {"fireball"}
+
+
+def test_learned_returns_a_live_read_only_view():
+    skills = SkillsService()
+    hero = Character("Hero", max_hp=20)
+    view = skills.learned(hero)
+    skills.learn(hero, Skill(id="dash", name="Dash", required_level=1))
+
+    assert view == {"dash"}
+    assert skills.learned(hero) is view
+    assert view | {"fireball"} == {"dash", "fireball"}
+    assert view == {"dash"}
+    with pytest.raises(AttributeError):
+        skills.learned(hero).add("fireball")  # type: ignore[attr-defined]
+
+
+def test_learned_skills_do_not_keep_character_alive():
+    skills = SkillsService()
+    hero = Character("Temp", max_hp=20)
+    skills.learn(hero, Skill(id="dash", name="Dash", required_level=1))
+    hero_ref = weakref.ref(hero)
+
+    del hero
+    gc.collect()
+    assert hero_ref() is None
+
+
+def test_can_learn_many_matches_can_learn():
+    heroes = [Character("Plain", max_hp=30)] + [
+        Character.from_class(character_class, "Hero", max_hp=30)
+        for character_class in (WARRIOR, MAGE, ROGUE)
+    ]
+    leveling = LevelingService()
+    skills = SkillsService(leveling)
+    for xp in (0, 10, 20):
+        for hero in heroes:
+            leveling.gain_xp(hero, xp)
+            assert skills.can_learn_many(hero, ALL_UNIVERSAL_SKILLS) == [
+                skills.can_learn(hero, skill) for skill in ALL_UNIVERSAL_SKILLS
+            ]
@@ -14,7 +14,7 @@ from rpg.services.skills import SkillsService
 
 def test_warrior_prefers_mining_blacksmithing_first_aid() -> None:
     """Warrior gets 2-level reduction on mining, blacksmithing, and first_aid."""
-    char = Character("Tank", max_hp=100, character_class=WARRIOR)
+    char = Character.from_class(WARRIOR, "Tank", max_hp=100)
     leveling = LevelingService()
     skills = SkillsService(leveling)
 
@@ -29,14 +29,14 @@ def test_warrior_prefers_mining_blacksmithing_first_aid() -> None:
     assert skills.can_learn(char, BLACKSMITHING)
 
     # First Aid normally requires level 2, warrior needs level 1
-    char2 = Character("Tank2", max_hp=100, character_class=WARRIOR)
+    char2 = Character.from_class(WARRIOR, "Tank2", max_hp=100)
     assert leveling.level(char2) == 1
     assert skills.can_learn(char2, FIRST_AID)
 
 
 def test_mage_prefers_herbalism_alchemy_navigation() -> None:
     """Mage gets 2-level reduction on herbalism, alchemy, and navigation."""
-    char = Character("Wizard", max_hp=50, character_class=MAGE)
+    char = Character.from_class(MAGE, "Wizard", max_hp=50)
     leveling = LevelingService()
     skills = SkillsService(leveling)
 
@@ -57,7 +57,7 @@ def test_mage_prefers_herbalism_alchemy_navigation() -> None:
 
 def test_rogue_prefers_foraging_cooking_bartering() -> None:
     """Rogue gets 2-level reduction on foraging, cooking, and bartering."""
-    char = Character("Thief", max_hp=75, character_class=ROGUE)
+    char = Character.from_class(ROGUE, "Thief", max_hp=75)
     leveling = LevelingService()
     skills = SkillsService(leveling)
 
@@ -76,9 +76,9 @@ def test_rogue_prefers_foraging_cooking_bartering() -> None:
 
 def test_all_classes_can_learn_all_universal_skills() -> None:
     """Any class can learn any universal skill (flexible approach)."""
-    warrior = Character("Tank", max_hp=100, character_class=WARRIOR)
-    mage = Character("Wizard", max_hp=50, character_class=MAGE)
-    rogue = Character("Thief", max_hp=75, character_class=ROGUE)
+    warrior = Character.from_class(WARRIOR, "Tank", max_hp=100)
+    mage = Character.from_class(MAGE, "Wizard", max_hp=50)
+    rogue = Character.from_class(ROGUE, "Thief", max_hp=75)
     
     leveling = LevelingService()
     skills = SkillsService(leveling)
@@ -1 +1 @@
-"""RPG systems package - Cross-cutting game systems."""
+"""RPG systems package - Cross-cutting game systems."""
@@ -0,0 +1,174 @@
+"""Headless combat simulation for balance testing.
+
+Runs complete fights on plain integer stats without ``Character`` objects or
+console I/O, so large batches of matchups (e.g. "Warrior vs Orc" thousands of
+times) can be simulated quickly from scripts or tests.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from rpg.systems.combat import RandomProvider
+
+# (max_hp, attack, defense)
+FighterStats = tuple[int, int, int]
+
+SIDE_A_WINS = 0
+SIDE_B_WINS = 1
+DRAW = -1
+
+
+def simulate_fight(
+    fighter_a: FighterStats,
+    fighter_b: FighterStats,
+    random_provider: RandomProvider | None = None,
+    crit_chance: float = 0.0,
+) -> int:
+    """Fight two stat blocks to the death and return the winning side.
+
+    Fighters alternate attacks, with ``fighter_a`` striking first (as the
+    player does in the CLI game). Damage follows ``resolve_attack``:
+    (attack - defense), minimum 0, doubled on a critical hit.
+
+    Args:
+        fighter_a: (max_hp, attack, defense) of the side that attacks first
+        fighter_b: (max_hp, attack, defense) of the side that attacks second
+        random_provider: Optional RNG for critical hit calculation
+        crit_chance: Probability of critical hit (0.0-1.0), requires random_provider
+
+    Returns:
+        SIDE_A_WINS, SIDE_B_WINS, or DRAW if neither side can damage the other
+
+    Examples:
+        >>> simulate_fight((50, 10, 2), (30, 6, 1))
+        0
+        >>> simulate_fight((10, 3, 0), (60, 8, 2))
+        1
+        >>> simulate_fight((50, 2, 5), (50, 3, 5))  # Neither can hurt the other
+        -1
+    """
+    hp_a, attack_a, defense_a = fighter_a
+    hp_b, attack_b, defense_b = fighter_b
+    damage_to_b = attack_a - defense_b if attack_a > defense_b else 0
+    damage_to_a = attack_b - defense_a if attack_b > defense_a else 0
+    if damage_to_a == 0 and damage_to_b == 0:
+        return DRAW
+
+    rolls_crits = random_provider is not None and crit_chance > 0.0
+    # Bound once: fights can run many rounds, each rolling up to twice
+    roll = random_provider.random if rolls_crits else None
+    while True:
+        damage = damage_to_b
+        if rolls_crits and roll() < crit_chance:
+            damage *= 2
+        hp_b -= damage
+        if hp_b <= 0:
+            return SIDE_A_WINS
+
+        damage = damage_to_a
+        if rolls_crits and roll() < crit_chance:
+            damage *= 2
+        hp_a -= damage
+        if hp_a <= 0:
+            return SIDE_B_WINS
+
+
+def simulate_fights(
+    side_a: Sequence[FighterStats],
+    side_b: Sequence[FighterStats],
+    random_provider: RandomProvider | None = None,
+    crit_chance: float = 0.0,
+) -> list[int]:
+    """Simulate pairwise fights between two equally sized lists of fighters.
+
+    Args:
+        side_a: Fighters that attack first, one per matchup
+        side_b: Opponents, paired with ``side_a`` by position
+        random_provider: Optional RNG shared by all fights (e.g. random.Random(seed))
+        crit_chance: Probability of critical hit (0.0-1.0), requires random_provider
+
+    Returns:
+        Outcome of each matchup (SIDE_A_WINS, SIDE_B_WINS, or DRAW)
+
+    Raises:
+        ValueError: If the two sides have different lengths
+
+    Examples:
+        >>> simulate_fights([(50, 10, 2), (10, 3, 0)], [(30, 6, 1), (60, 8, 2)])
+        [0, 1]
+    """
+    return [
+        simulate_fight(fighter_a, fighter_b, random_provider, crit_chance)
+        for fighter_a, fighter_b in zip(side_a, side_b, strict=True)
+    ]
+
+
+def resolve_attacks_batch(
+    attacks: Sequence[int],
+    defenses: Sequence[int],
+    random_provider: RandomProvider | None = None,
+    crit_chance: float = 0.0,
+) -> list[int]:
+    """Compute the damage of many simultaneous attacks (waves, area-of-effect hits).
+
+    Batch counterpart to ``resolve_attack`` on plain stats: damage is
+    (attack - defense), minimum 0, doubled on a critical hit. Nothing is
+    applied; pass the result to ``apply_damage_batch`` to update HP.
+
+    Args:
+        attacks: Attack stat of each attacker
+        defenses: Defense stat of each defender, paired with ``attacks`` by position
+        random_provider: Optional RNG for critical hits, rolled once per attack in order
+        crit_chance: Probability of critical hit (0.0-1.0), requires random_provider
+
+    Returns:
+        Damage dealt by each attack
+
+    Raises:
+        ValueError: If the two sequences have different lengths
+
+    Examples:
+        >>> resolve_attacks_batch([10, 4, 7], [3, 6, 7])
+        [7, 0, 0]
+        >>> hit_points = [20, 15, 9]
+        >>> apply_damage_batch(hit_points, resolve_attacks_batch([10, 4, 12], [3, 6, 2]))
+        >>> hit_points
+        [13, 15, 0]
+    """
+    damages = [
+        attack - defense if attack > defense else 0
+        for attack, defense in zip(attacks, defenses, strict=True)
+    ]
+    if crit_chance > 0.0 and random_provider is not None:
+        roll = random_provider.random
+        damages = [damage + damage if roll() < crit_chance else damage for damage in damages]
+    return damages
+
+
+def apply_damage_batch(hit_points: list[int], damages: Sequence[int]) -> None:
+    """Apply one damage value to each entry of ``hit_points`` in place.
+
+    Batch counterpart to ``Character.take_damage`` for area-of-effect hits,
+    damage-over-time ticks and similar per-frame updates: HP is clamped at 0.
+    Damage is validated once for the whole batch rather than per entry.
+
+    Args:
+        hit_points: Current HP values (modified in place)
+        damages: Non-negative damage per entry, paired with ``hit_points`` by position
+
+    Raises:
+        ValueError: If the sequences differ in length or any damage is negative
+
+    Examples:
+        >>> hit_points = [30, 8, 0]
+        >>> apply_damage_batch(hit_points, [10, 10, 5])
+        >>> hit_points
+        [20, 0, 0]
+    """
+    if min(damages, default=0) < 0:
+        raise ValueError("damage amount must be non-negative")
+    hit_points[:] = [
+        hp - damage if hp > damage else 0
+        for hp, damage in zip(hit_points, damages, strict=True)
+    ]
@@ -0,0 +1,94 @@
+import pytest
+
+from rpg.entities.character import Character
+from rpg.systems.combat import resolve_attack
+from rpg.systems.combat_batch import (
+    DRAW,
+    SIDE_A_WINS,
+    SIDE_B_WINS,
+    apply_damage_batch,
+    resolve_attacks_batch,
+    simulate_fight,
+    simulate_fights,
+)
+
+
+class _FixedRng:
+    def __init__(self, value: float):
+        self._value = value
+
+    def random(self) -> float:
+        return self._value
+
+
+def test_simulated_fight_matches_resolve_attack_loop():
+    hero = Character("Hero", max_hp=40, attack=9, defense=2)
+    wolf = Character("Wolf", max_hp=50, attack=8, defense=3)
+
+    # Reference fight using the Character-based combat system
+    while hero.is_alive() and wolf.is_alive():
+        resolve_attack(hero, wolf)
+        if wolf.is_alive():
+            resolve_attack(wolf, hero)
+    expected = SIDE_A_WINS if hero.is_alive() else SIDE_B_WINS
+
+    assert simulate_fight((40, 9, 2), (50, 8, 3)) == expected
+
+
+def test_critical_hits_double_damage():
+    # Both sides deal 5 per hit; with every roll a crit (0.1 < 0.5) they deal
+    # 10, and the side striking first kills its opponent in two hits
+    no_crits = simulate_fight((12, 6, 0), (20, 5, 1))
+    with_crits = simulate_fight(
+        (12, 6, 0), (20, 5, 1), random_provider=_FixedRng(0.1), crit_chance=0.5
+    )
+    assert no_crits == SIDE_B_WINS
+    assert with_crits == SIDE_A_WINS
+
+
+def test_fight_where_nobody_can_deal_damage_is_a_draw():
+    assert simulate_fight((30, 2, 5), (30, 4, 5)) == DRAW
+
+
+def test_simulate_fights_pairs_by_position():
+    results = simulate_fights(
+        [(50, 10, 2), (10, 3, 0), (30, 1, 9)],
+        [(30, 6, 1), (60, 8, 2), (30, 1, 9)],
+    )
+    assert results == [SIDE_A_WINS, SIDE_B_WINS, DRAW]
+
+
+def test_simulate_fights_rejects_mismatched_sides():
+    with pytest.raises(ValueError):
+        simulate_fights([(10, 5, 0)], [])
+
+
+def test_apply_damage_batch_matches_take_damage():
+    characters = [Character(f"Goblin {i}", max_hp=hp) for i, hp in enumerate((40, 12, 5))]
+    damages = [15, 12, 9]
+    hit_points = [character.hp for character in characters]
+
+    for character, damage in zip(characters, damages):
+        character.take_damage(damage)
+    apply_damage_batch(hit_points, damages)
+
+    assert hit_points == [character.hp for character in characters]
+
+
+def test_apply_damage_batch_rejects_negative_damage():
+    hit_points = [10, 10]
+    with pytest.raises(ValueError):
+        apply_damage_batch(hit_points, [3, -1])
+    assert hit_points == [10, 10]
+
+
+def test_resolve_attacks_batch_matches_resolve_attack():
+    pairs = [(10, 3), (4, 6), (9, 1)]
+    expected = []
+    for attack, defense in pairs:
+        attacker = Character("A", max_hp=10, attack=attack)
+        defender = Character("D", max_hp=50, defense=defense)
+        expected.append(resolve_attack(attacker, defender, _FixedRng(0.1), crit_chance=0.5))
+
+    attacks, defenses = zip(*pairs)
+    assert resolve_attacks_batch(attacks, defenses, _FixedRng(0.1), crit_chance=0.5) == expected